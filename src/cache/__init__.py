@@ -0,0 +1,2 @@
+# Cache package
+
@@ -0,0 +1,121 @@
+"""
+In-process cache for single-document reads.
+
+Caches documents by (collection, id) per worker process so repeated
+GET /api/<domain>/<id> calls skip the MongoDB round-trip. Services invalidate
+an entry when they update the document; other worker processes may serve the
+previous version until their TTL expires, so the TTL is kept short.
+
+A read that misses takes a generation() stamp before going to MongoDB and
+passes it to put(); if the document was invalidated in the meantime the
+(possibly stale) result is not stored. Documents are copied on the way in
+and out so callers never share the cached dict.
+
+Hit and miss counts are exported on the /metrics endpoint.
+"""
+import copy
+import threading
+from cachetools import TTLCache
+from prometheus_client import Counter
+
+# Time-to-live (seconds) for cached documents; bounds cross-worker staleness
+TTL = 5
+
+# Maximum number of documents cached per worker
+MAXSIZE = 10_000
+
+_lock = threading.RLock()
+_cache: TTLCache = TTLCache(maxsize=MAXSIZE, ttl=TTL)
+
+# Generation at which each key was last invalidated; entries only need to
+# outlive a MongoDB read, so they expire well after any in-flight fill
+_generation = 0
+_invalidated: TTLCache = TTLCache(maxsize=MAXSIZE, ttl=60)
+# Generation of the last clear(); fills stamped at or before it are dropped
+_cleared = -1
+
+CACHE_HITS = Counter(
+    'document_cache_hits',
+    'Single-document reads served from the in-process cache',
+    ['collection'],
+)
+CACHE_MISSES = Counter(
+    'document_cache_misses',
+    'Single-document reads that fell through to MongoDB',
+    ['collection'],
+)
+
+
+def get(collection, document_id):
+    """
+    Look up a cached document.
+
+    Args:
+        collection: Collection name
+        document_id: Document ID
+
+    Returns:
+        dict|None: A copy of the cached document, or None on a miss
+    """
+    with _lock:
+        document = _cache.get((collection, document_id))
+    if document is None:
+        CACHE_MISSES.labels(collection).inc()
+        return None
+    CACHE_HITS.labels(collection).inc()
+    return copy.deepcopy(document)
+
+
+def generation():
+    """
+    Stamp a cache fill; take it before reading the document from MongoDB.
+
+    Returns:
+        int: The current generation, to pass to put()
+    """
+    with _lock:
+        return _generation
+
+
+def put(collection, document_id, document, generation):
+    """
+    Cache a copy of a document, unless it was invalidated since generation.
+
+    Args:
+        collection: Collection name
+        document_id: Document ID
+        document: The document to cache
+        generation: Value of generation() taken before the document was read
+    """
+    document = copy.deepcopy(document)
+    key = (collection, document_id)
+    with _lock:
+        if generation <= _cleared or _invalidated.get(key, -1) >= generation:
+            return
+        _cache[key] = document
+
+
+def invalidate(collection, document_id):
+    """
+    Drop a cached document.
+
+    Args:
+        collection: Collection name
+        document_id: Document ID
+    """
+    global _generation
+    key = (collection, document_id)
+    with _lock:
+        _invalidated[key] = _generation
+        _generation += 1
+        _cache.pop(key, None)
+
+
+def clear():
+    """Drop all cached documents and any fill still in flight."""
+    global _generation, _cleared
+    with _lock:
+        _cache.clear()
+        _invalidated.clear()
+        _cleared = _generation
+        _generation += 1
@@ -0,0 +1,103 @@
+"""
+In-process cache for infinite scroll list queries.
+
+Caches list query results per worker process for a short TTL so repeated
+requests for the same batch are served without a MongoDB round-trip.
+Services invalidate a prefix whenever they create or update a document; other
+worker processes may serve a stale batch until their TTL expires, so the TTL
+is kept short. Each prefix has a generation that invalidate() advances; a
+query that was in flight when its prefix was invalidated is not stored.
+Results are copied on the way in and out so callers never share a cached
+batch.
+"""
+import copy
+import threading
+from functools import wraps
+from cachetools import TTLCache
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Default time-to-live (seconds) for cached list batches; bounds cross-worker staleness
+DEFAULT_TTL = 5
+
+# Default number of distinct queries cached per prefix
+DEFAULT_MAXSIZE = 256
+
+_lock = threading.RLock()
+_caches: dict[str, TTLCache] = {}
+_settings: dict[str, tuple[float, int]] = {}
+_generations: dict[str, int] = {}
+_MISSING = object()
+
+
+def cached(prefix, ttl=DEFAULT_TTL, maxsize=DEFAULT_MAXSIZE):
+    """
+    Cache the result of a keyword-only query function.
+
+    The cache key is built from the keyword arguments, so callers must pass
+    every query parameter by name. Exceptions are not cached.
+
+    Args:
+        prefix: Cache namespace, used for invalidation (e.g. 'platforms')
+        ttl: Seconds a cached result stays valid
+        maxsize: Maximum number of distinct queries kept for this prefix
+
+    Returns:
+        Decorator wrapping the query function
+
+    Raises:
+        ValueError: If prefix is already registered with a different ttl or maxsize
+    """
+    with _lock:
+        settings = _settings.setdefault(prefix, (ttl, maxsize))
+        if settings != (ttl, maxsize):
+            raise ValueError(
+                f"List cache prefix {prefix!r} already registered with "
+                f"ttl={settings[0]}, maxsize={settings[1]}"
+            )
+        cache = _caches.setdefault(prefix, TTLCache(maxsize=maxsize, ttl=ttl))
+        _generations.setdefault(prefix, 0)
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(**kwargs):
+            key = tuple(sorted(kwargs.items()))
+            with _lock:
+                result = cache.get(key, _MISSING)
+                generation = _generations[prefix]
+            if result is not _MISSING:
+                logger.debug("List cache hit for %s", prefix)
+                return copy.deepcopy(result)
+
+            result = func(**kwargs)
+            stored = copy.deepcopy(result)
+            with _lock:
+                # Skip the store if a write invalidated the prefix mid-query
+                if _generations[prefix] == generation:
+                    cache[key] = stored
+            return result
+        return wrapper
+    return decorator
+
+
+def invalidate(prefix):
+    """
+    Drop all cached results for a prefix.
+
+    Args:
+        prefix: Cache namespace passed to @cached
+    """
+    with _lock:
+        cache = _caches.get(prefix)
+        if cache is not None:
+            cache.clear()
+            _generations[prefix] += 1
+
+
+def clear():
+    """Drop all cached results for every prefix."""
+    with _lock:
+        for prefix, cache in _caches.items():
+            cache.clear()
+            _generations[prefix] += 1
@@ -0,0 +1,49 @@
+"""
+orjson-backed JSON provider for the Flask app.
+
+Extends the api_utils MongoJSONEncoder so ObjectId and datetime values keep
+their existing wire format, while the rest of each payload is serialized by
+orjson instead of the pure-Python stdlib encoder.
+"""
+import orjson
+from api_utils import MongoJSONEncoder
+
+# Datetimes are passed through to MongoJSONEncoder.default so their format is unchanged
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+class ORJSONProvider(MongoJSONEncoder):
+    """
+    JSON provider that serializes with orjson.
+
+    Types orjson doesn't handle natively (ObjectId, datetime, Decimal, ...)
+    fall back to the MongoJSONEncoder default() hook.
+    """
+
+    def _options(self):
+        return _OPTIONS | orjson.OPT_SORT_KEYS if self.sort_keys else _OPTIONS
+
+    def dumps_bytes(self, obj):
+        """
+        Serialize obj to UTF-8 encoded JSON bytes.
+
+        Args:
+            obj: The data to serialize
+
+        Returns:
+            bytes: The JSON document
+        """
+        return orjson.dumps(obj, default=self.default, option=self._options())
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string; stdlib json kwargs are ignored."""
+        return self.dumps_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes; stdlib json kwargs are ignored."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response without round-tripping the body through str."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
@@ -0,0 +1,47 @@
+"""
+Conditional GET support for single-document routes.
+
+Clients polling a document send back the ETag they were given; while the
+document is unchanged they get an empty 304 instead of the re-serialized body.
+"""
+import hashlib
+from flask import current_app, request
+
+
+def document_etag(document_id, document):
+    """
+    Compute the ETag for a document.
+
+    Every write stamps a new saved breadcrumb, so id + saved.at_time changes
+    whenever the document does.
+
+    Args:
+        document_id: The document ID
+        document: The document dictionary
+
+    Returns:
+        str: Short hex digest identifying this version of the document
+    """
+    saved_at = (document.get('saved') or {}).get('at_time')
+    return hashlib.blake2b(f"{document_id}:{saved_at}".encode(), digest_size=8).hexdigest()
+
+
+def conditional_response(document_id, document):
+    """
+    Build a JSON response for a document, honoring If-None-Match.
+
+    Args:
+        document_id: The document ID
+        document: The document dictionary
+
+    Returns:
+        Response: 304 with no body if the client's ETag matches, otherwise 200
+        with the JSON document; both carry the ETag header
+    """
+    etag = document_etag(document_id, document)
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.json.response(document)
+    response.set_etag(etag)
+    return response
@@ -0,0 +1,41 @@
+"""
+Lazily built breadcrumb for read-only routes.
+
+Reads never persist the breadcrumb, so building it (timestamp, correlation ID,
+client IP) on every GET is wasted work unless something actually reads it.
+"""
+from collections.abc import Mapping
+
+
+class LazyBreadcrumb(Mapping):
+    """
+    Read-only breadcrumb mapping that is built on first access.
+
+    Behaves like the dict returned by the factory; the factory is called at
+    most once, so it must be read while the request context is still active.
+    """
+    __slots__ = ('_factory', '_token', '_breadcrumb')
+
+    def __init__(self, factory, token):
+        """
+        Args:
+            factory: Breadcrumb factory, e.g. create_flask_breadcrumb
+            token: Token dictionary passed to the factory
+        """
+        self._factory = factory
+        self._token = token
+        self._breadcrumb = None
+
+    def _resolve(self):
+        if self._breadcrumb is None:
+            self._breadcrumb = self._factory(self._token)
+        return self._breadcrumb
+
+    def __getitem__(self, key):
+        return self._resolve()[key]
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __len__(self):
+        return len(self._resolve())
@@ -7,25 +7,55 @@ Provides endpoints for Platform domain:
 - GET /api/platform/<id> - Get a specific platform document by ID
 - PATCH /api/platform/<id> - Update a platform document
 """
-from flask import Blueprint, jsonify, request
+from functools import lru_cache
+from flask import Blueprint, g, request
 from api_utils.flask_utils.token import create_flask_token
 from api_utils.flask_utils.breadcrumb import create_flask_breadcrumb
 from api_utils.flask_utils.route_wrapper import handle_route_exceptions
-from src.services.platform_service import PlatformService
+from src.routes.lazy_breadcrumb import LazyBreadcrumb
+from src.routes.conditional import conditional_response
+from src.services.platform_service import PlatformService, ALLOWED_SORT_FIELDS
+from src.services.infinite_scroll import validate_infinite_scroll_params, parse_fields_param
 
 import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def create_platform_routes():
     """
     Create a Flask Blueprint exposing platform endpoints.
     
+    The Blueprint is built once and memoized; later calls (app factory
+    reloads, tests) return the same object.
+    
     Returns:
         Blueprint: Flask Blueprint with platform routes
     """
     platform_routes = Blueprint('platform_routes', __name__)
     
+    # Handlers return plain dicts; Flask serializes them with app.json (the
+    # orjson provider) directly, without the jsonify() argument handling.
+    
+    @platform_routes.before_request
+    @handle_route_exceptions
+    def authenticate():
+        """
+        Build the token and breadcrumb for every platform request in one place.
+        
+        Reads don't store the breadcrumb, so GET and HEAD requests get a
+        LazyBreadcrumb that is only built if something reads it. Writes persist
+        it in the document, so they get the real dict. OPTIONS is answered by
+        Flask without a handler, so preflight and discovery need no token.
+        """
+        if request.method == 'OPTIONS':
+            return
+        g.token = create_flask_token()
+        if request.method in ('GET', 'HEAD'):
+            g.breadcrumb = LazyBreadcrumb(create_flask_breadcrumb, g.token)
+        else:
+            g.breadcrumb = create_flask_breadcrumb(g.token)
+    
     @platform_routes.route('', methods=['POST'])
     @handle_route_exceptions
     def create_platform():
@@ -43,15 +73,14 @@ def create_platform_routes():
         Returns:
             JSON response with the created platform document including _id
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token = g.token
+        breadcrumb = g.breadcrumb
         
         data = request.get_json() or {}
-        platform_id = PlatformService.create_platform(data, token, breadcrumb)
-        platform = PlatformService.get_platform(platform_id, token, breadcrumb)
+        platform = PlatformService.create_platform(data, token, breadcrumb)
         
-        logger.info(f"create_platform Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
-        return jsonify(platform), 201
+        logger.info("create_platform Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        return platform, 201
     
     @platform_routes.route('', methods=['GET'])
     @handle_route_exceptions
@@ -65,6 +94,7 @@ def create_platform_routes():
             limit: Items per batch (default: 10, max: 100)
             sort_by: Field to sort by (default: 'name')
             order: Sort order 'asc' or 'desc' (default: 'asc')
+            fields: Optional comma separated fields to return, e.g. 'name,status' (default: all)
         
         Returns:
             JSON response with infinite scroll results: {
@@ -77,8 +107,8 @@ def create_platform_routes():
         Raises:
             400 Bad Request: If invalid parameters provided
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token = g.token
+        breadcrumb = g.breadcrumb
         
         # Get query parameters
         name = request.args.get('name')
@@ -87,8 +117,11 @@ def create_platform_routes():
         sort_by = request.args.get('sort_by', 'name')
         order = request.args.get('order', 'asc')
         
-        # Service layer validates parameters and raises HTTPBadRequest if invalid
-        # @handle_route_exceptions decorator will catch and format the exception
+        # Reject invalid paging parameters before any service or MongoDB work
+        # @handle_route_exceptions decorator will catch and format the HTTPBadRequest
+        validate_infinite_scroll_params(limit, sort_by, order, ALLOWED_SORT_FIELDS)
+        fields = parse_fields_param(request.args.get('fields'))
+        
         result = PlatformService.get_platforms(
             token, 
             breadcrumb, 
@@ -96,11 +129,12 @@ def create_platform_routes():
             after_id=after_id,
             limit=limit,
             sort_by=sort_by,
-            order=order
+            order=order,
+            fields=fields
         )
         
-        logger.info(f"get_platforms Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
-        return jsonify(result), 200
+        logger.info("get_platforms Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        return result, 200
     
     @platform_routes.route('/<platform_id>', methods=['GET'])
     @handle_route_exceptions
@@ -112,14 +146,16 @@ def create_platform_routes():
             platform_id: The platform ID to retrieve
             
         Returns:
-            JSON response with the platform document
+            JSON response with the platform document and its ETag, or an
+            empty 304 if the If-None-Match header matches the current ETag
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token = g.token
+        breadcrumb = g.breadcrumb
         
         platform = PlatformService.get_platform(platform_id, token, breadcrumb)
-        logger.info(f"get_platform Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
-        return jsonify(platform), 200
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("get_platform Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        return conditional_response(platform_id, platform)
     
     @platform_routes.route('/<platform_id>', methods=['PATCH'])
     @handle_route_exceptions
@@ -141,14 +177,14 @@ def create_platform_routes():
         Returns:
             JSON response with the updated platform document
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token = g.token
+        breadcrumb = g.breadcrumb
         
         data = request.get_json() or {}
         platform = PlatformService.update_platform(platform_id, data, token, breadcrumb)
         
-        logger.info(f"update_platform Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
-        return jsonify(platform), 200
+        logger.info("update_platform Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        return platform, 200
     
     logger.info("Platform Flask Routes Registered")
     return platform_routes
\ No newline at end of file
@@ -7,25 +7,55 @@ Provides endpoints for User domain:
 - GET /api/user/<id> - Get a specific user document by ID
 - PATCH /api/user/<id> - Update a user document
 """
-from flask import Blueprint, jsonify, request
+from functools import lru_cache
+from flask import Blueprint, g, request
 from api_utils.flask_utils.token import create_flask_token
 from api_utils.flask_utils.breadcrumb import create_flask_breadcrumb
 from api_utils.flask_utils.route_wrapper import handle_route_exceptions
-from src.services.user_service import UserService
+from src.routes.lazy_breadcrumb import LazyBreadcrumb
+from src.routes.conditional import conditional_response
+from src.services.user_service import UserService, ALLOWED_SORT_FIELDS
+from src.services.infinite_scroll import validate_infinite_scroll_params, parse_fields_param
 
 import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def create_user_routes():
     """
     Create a Flask Blueprint exposing user endpoints.
     
+    The Blueprint is built once and memoized; later calls (app factory
+    reloads, tests) return the same object.
+    
     Returns:
         Blueprint: Flask Blueprint with user routes
     """
     user_routes = Blueprint('user_routes', __name__)
     
+    # Handlers return plain dicts; Flask serializes them with app.json (the
+    # orjson provider) directly, without the jsonify() argument handling.
+    
+    @user_routes.before_request
+    @handle_route_exceptions
+    def authenticate():
+        """
+        Build the token and breadcrumb for every user request in one place.
+        
+        Reads don't store the breadcrumb, so GET and HEAD requests get a
+        LazyBreadcrumb that is only built if something reads it. Writes persist
+        it in the document, so they get the real dict. OPTIONS is answered by
+        Flask without a handler, so preflight and discovery need no token.
+        """
+        if request.method == 'OPTIONS':
+            return
+        g.token = create_flask_token()
+        if request.method in ('GET', 'HEAD'):
+            g.breadcrumb = LazyBreadcrumb(create_flask_breadcrumb, g.token)
+        else:
+            g.breadcrumb = create_flask_breadcrumb(g.token)
+    
     @user_routes.route('', methods=['POST'])
     @handle_route_exceptions
     def create_user():
@@ -43,15 +73,14 @@ def create_user_routes():
         Returns:
             JSON response with the created user document including _id
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token = g.token
+        breadcrumb = g.breadcrumb
         
         data = request.get_json() or {}
-        user_id = UserService.create_user(data, token, breadcrumb)
-        user = UserService.get_user(user_id, token, breadcrumb)
+        user = UserService.create_user(data, token, breadcrumb)
         
-        logger.info(f"create_user Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
-        return jsonify(user), 201
+        logger.info("create_user Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        return user, 201
     
     @user_routes.route('', methods=['GET'])
     @handle_route_exceptions
@@ -65,6 +94,7 @@ def create_user_routes():
             limit: Items per batch (default: 10, max: 100)
             sort_by: Field to sort by (default: 'name')
             order: Sort order 'asc' or 'desc' (default: 'asc')
+            fields: Optional comma separated fields to return, e.g. 'name,status' (default: all)
         
         Returns:
             JSON response with infinite scroll results: {
@@ -77,8 +107,8 @@ def create_user_routes():
         Raises:
             400 Bad Request: If invalid parameters provided
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token = g.token
+        breadcrumb = g.breadcrumb
         
         # Get query parameters
         name = request.args.get('name')
@@ -87,8 +117,11 @@ def create_user_routes():
         sort_by = request.args.get('sort_by', 'name')
         order = request.args.get('order', 'asc')
         
-        # Service layer validates parameters and raises HTTPBadRequest if invalid
-        # @handle_route_exceptions decorator will catch and format the exception
+        # Reject invalid paging parameters before any service or MongoDB work
+        # @handle_route_exceptions decorator will catch and format the HTTPBadRequest
+        validate_infinite_scroll_params(limit, sort_by, order, ALLOWED_SORT_FIELDS)
+        fields = parse_fields_param(request.args.get('fields'))
+        
         result = UserService.get_users(
             token, 
             breadcrumb, 
@@ -96,11 +129,12 @@ def create_user_routes():
             after_id=after_id,
             limit=limit,
             sort_by=sort_by,
-            order=order
+            order=order,
+            fields=fields
         )
         
-        logger.info(f"get_users Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
-        return jsonify(result), 200
+        logger.info("get_users Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        return result, 200
     
     @user_routes.route('/<user_id>', methods=['GET'])
     @handle_route_exceptions
@@ -112,14 +146,16 @@ def create_user_routes():
             user_id: The user ID to retrieve
             
         Returns:
-            JSON response with the user document
+            JSON response with the user document and its ETag, or an
+            empty 304 if the If-None-Match header matches the current ETag
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token = g.token
+        breadcrumb = g.breadcrumb
         
         user = UserService.get_user(user_id, token, breadcrumb)
-        logger.info(f"get_user Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
-        return jsonify(user), 200
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("get_user Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        return conditional_response(user_id, user)
     
     @user_routes.route('/<user_id>', methods=['PATCH'])
     @handle_route_exceptions
@@ -141,14 +177,14 @@ def create_user_routes():
         Returns:
             JSON response with the updated user document
         """
-        token = create_flask_token()
-        breadcrumb = create_flask_breadcrumb(token)
+        token = g.token
+        breadcrumb = g.breadcrumb
         
         data = request.get_json() or {}
         user = UserService.update_user(user_id, data, token, breadcrumb)
         
-        logger.info(f"update_user Success {str(breadcrumb['at_time'])}, {breadcrumb['correlation_id']}")
-        return jsonify(user), 200
+        logger.info("update_user Success %s, %s", breadcrumb['at_time'], breadcrumb['correlation_id'])
+        return user, 200
     
     logger.info("User Flask Routes Registered")
     return user_routes
\ No newline at end of file
@@ -23,10 +23,16 @@ mongo = MongoIO.get_instance()
 config.set_enumerators(mongo.get_documents(config.ENUMERATORS_COLLECTION_NAME))
 config.set_versions(mongo.get_documents(config.VERSIONS_COLLECTION_NAME))
 
-# Initialize Flask App
-from api_utils import MongoJSONEncoder
+# Ensure indexes backing the list queries exist
+from src.services.platform_service import PlatformService
+from src.services.user_service import UserService
+PlatformService.ensure_indexes()
+UserService.ensure_indexes()
+
+# Initialize Flask App (orjson-backed provider, Mongo-aware like MongoJSONEncoder)
+from src.json_provider import ORJSONProvider
 app = Flask(__name__)
-app.json = MongoJSONEncoder(app)
+app.json = ORJSONProvider(app)
 
 # Route registration (all grouped together)
 from api_utils import (
@@ -0,0 +1,342 @@
+"""
+Generic CRUD service for document domains.
+
+Implements create, infinite scroll list, get and update once for every domain
+stored as plain documents in its own collection. Domain services subclass
+CrudService and only declare their entity name, collection and sort fields.
+"""
+from collections.abc import Callable, Mapping
+from typing import Any, ClassVar, Optional
+from api_utils import MongoIO, Config
+from api_utils.flask_utils.exceptions import HTTPBadRequest, HTTPForbidden, HTTPNotFound, HTTPInternalServerError
+from pymongo import ASCENDING
+from src.cache import list_cache, document_cache
+from src.services.infinite_scroll import execute_infinite_scroll_query
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Request token and stored breadcrumb/document shapes
+Token = dict[str, Any]
+Document = dict[str, Any]
+
+# System-managed fields clients may never update (a tuple keeps the checks
+# and error messages in a fixed order)
+_RESTRICTED_FIELDS: tuple[str, ...] = ('_id', 'created', 'saved')
+
+# MongoIO and Config are process-wide singletons, bound on first use
+_mongo = None
+_config = None
+
+
+def _bindings():
+    """Return the (MongoIO, Config) singletons, resolving them only once."""
+    global _mongo, _config
+    if _mongo is None:
+        _config = Config.get_instance()
+        _mongo = MongoIO.get_instance()
+    return _mongo, _config
+
+
+class CrudService:
+    """
+    Base class for document domain services.
+
+    Subclasses set:
+        ENTITY: Lower-case domain name used in messages and cache prefixes (e.g. 'platform')
+        COLLECTION_SETTING: Config attribute holding the collection name (e.g. 'PLATFORM_COLLECTION_NAME')
+        ALLOWED_SORT_FIELDS: Fields the list query may sort by
+
+    Handles:
+    - RBAC authorization checks (placeholder for future implementation)
+    - MongoDB operations via MongoIO singleton
+    - Read caching and cache invalidation on writes
+    """
+    ENTITY: ClassVar[str]
+    COLLECTION_SETTING: ClassVar[str]
+    ALLOWED_SORT_FIELDS: ClassVar[list[str]] = ['name']
+
+    # Set per domain by __init_subclass__
+    _list_cache_prefix: ClassVar[str]
+    _find_many: ClassVar[Callable[..., dict[str, Any]]]
+
+    def __init_subclass__(cls, **kwargs):
+        """Give each domain its own list cache namespace."""
+        super().__init_subclass__(**kwargs)
+        cls._list_cache_prefix = f"{cls.ENTITY}s"
+        cls._find_many = staticmethod(list_cache.cached(cls._list_cache_prefix)(cls._query_many))
+
+    @staticmethod
+    def _check_permission(token: Token, operation: str) -> None:
+        """
+        Check if the user has permission to perform an operation.
+
+        Args:
+            token: Token dictionary with user_id and roles
+            operation: The operation being performed (e.g., 'read', 'create', 'update')
+
+        Raises:
+            HTTPForbidden: If user doesn't have required permission
+
+        Note: This is a placeholder for future RBAC implementation.
+        For now, all operations require a valid token (authentication only).
+        Subclasses override this to apply domain specific rules.
+
+        Example RBAC implementation:
+            if operation == 'update':
+                # Update requires admin role
+                if 'admin' not in token.get('roles', []):
+                    raise HTTPForbidden("Admin role required to update documents")
+            elif operation == 'create':
+                # Create requires staff or admin role
+                if not any(role in token.get('roles', []) for role in ['staff', 'admin']):
+                    raise HTTPForbidden("Staff or admin role required to create documents")
+            elif operation == 'read':
+                # Read requires any authenticated user (no additional check needed)
+                pass
+        """
+        pass
+
+    @staticmethod
+    def _validate_update_data(data: Document) -> None:
+        """
+        Validate update data to prevent security issues.
+
+        Args:
+            data: Dictionary of fields to update
+
+        Raises:
+            HTTPForbidden: If update data contains restricted fields
+        """
+        # Prevent updates to _id and system-managed fields: three dict lookups,
+        # whatever the size of the payload
+        for field in _RESTRICTED_FIELDS:
+            if field in data:
+                raise HTTPForbidden(f"Cannot update {field} field")
+
+    @classmethod
+    def _collection_name(cls) -> str:
+        """Resolve the domain's collection name from Config."""
+        _, config = _bindings()
+        return getattr(config, cls.COLLECTION_SETTING)
+
+    @classmethod
+    def ensure_indexes(cls) -> None:
+        """
+        Create the indexes backing the list query (no-op if they already exist).
+
+        One (sort_field, _id) index per allowed sort field, so the sort and the
+        after_id keyset cursor are a single index range seek. The name prefix
+        filter is case-insensitive, so it can't use tight bounds on the name
+        index; at best it scans the index keys instead of the documents.
+
+        Failures are logged rather than raised; queries still work without them.
+        """
+        try:
+            mongo, _ = _bindings()
+            collection = mongo.get_collection(cls._collection_name())
+            for field in cls.ALLOWED_SORT_FIELDS:
+                collection.create_index([(field, ASCENDING), ('_id', ASCENDING)])
+            logger.info("Ensured %s indexes", cls.ENTITY)
+        except Exception as e:
+            logger.error("Error creating %s indexes: %s", cls.ENTITY, e)
+
+    @classmethod
+    def create(cls, data: Document, token: Token, breadcrumb: Document) -> Document:
+        """
+        Create a new document.
+
+        Args:
+            data: Dictionary containing document data
+            token: Token dictionary with user_id and roles
+            breadcrumb: Breadcrumb dictionary for logging (contains at_time, by_user, from_ip, correlation_id)
+
+        Returns:
+            dict: The created document including its new _id (the stored data,
+            so callers don't need a second read)
+        """
+        try:
+            cls._check_permission(token, 'create')
+
+            # Remove _id if present (MongoDB will generate it)
+            if '_id' in data:
+                del data['_id']
+
+            # Automatically populate required fields: created and saved
+            # These are system-managed and should not be provided by the client
+            # Use breadcrumb directly as it already has the correct structure
+            data['created'] = breadcrumb
+            data['saved'] = breadcrumb
+
+            mongo, _ = _bindings()
+            document_id = mongo.create_document(cls._collection_name(), data)
+            list_cache.invalidate(cls._list_cache_prefix)
+            logger.info("Created %s %s for user %s", cls.ENTITY, document_id, token.get('user_id'))
+            return {**data, '_id': document_id}
+        except HTTPForbidden:
+            raise
+        except Exception as e:
+            error_msg = str(e)
+            logger.error("Error creating %s: %s", cls.ENTITY, error_msg)
+            raise HTTPInternalServerError(f"Failed to create {cls.ENTITY}: {error_msg}")
+
+    @classmethod
+    def get_many(cls, token: Token, breadcrumb: Mapping[str, Any], name: Optional[str] = None,
+                 after_id: Optional[str] = None, limit: int = 10, sort_by: str = 'name', order: str = 'asc',
+                 fields: Optional[tuple[str, ...]] = None) -> dict[str, Any]:
+        """
+        Get infinite scroll batch of sorted, filtered documents.
+
+        Args:
+            token: Authentication token
+            breadcrumb: Audit breadcrumb
+            name: Optional name prefix filter
+            after_id: Cursor (ID of last item from previous batch, None for first request)
+            limit: Items per batch
+            sort_by: Field to sort by
+            order: Sort order ('asc' or 'desc')
+            fields: Optional tuple of field names to return (see parse_fields_param)
+
+        Returns:
+            dict: {
+                'items': [...],
+                'limit': int,
+                'has_more': bool,
+                'next_cursor': str|None  # ID of last item, or None if no more
+            }
+
+        Raises:
+            HTTPBadRequest: If invalid parameters provided
+        """
+        try:
+            cls._check_permission(token, 'read')
+            result = cls._find_many(
+                collection_name=cls._collection_name(),
+                name=name,
+                after_id=after_id,
+                limit=limit,
+                sort_by=sort_by,
+                order=order,
+                fields=fields,
+            )
+            logger.info(
+                "Retrieved %d %ss (has_more=%s) for user %s",
+                len(result['items']), cls.ENTITY, result['has_more'], token.get('user_id')
+            )
+            return result
+        except HTTPBadRequest:
+            raise
+        except Exception as e:
+            logger.error("Error retrieving %ss: %s", cls.ENTITY, e)
+            raise HTTPInternalServerError(f"Failed to retrieve {cls.ENTITY}s")
+
+    @classmethod
+    def _query_many(cls, collection_name: str, name: Optional[str], after_id: Optional[str], limit: int,
+                    sort_by: str, order: str, fields: Optional[tuple[str, ...]]) -> dict[str, Any]:
+        """
+        Run the infinite scroll query.
+
+        Wrapped per subclass as _find_many, which caches results briefly per
+        query; cached results are invalidated on create and update.
+        """
+        mongo, _ = _bindings()
+        collection = mongo.get_collection(collection_name)
+        return execute_infinite_scroll_query(
+            collection,
+            name=name,
+            after_id=after_id,
+            limit=limit,
+            sort_by=sort_by,
+            order=order,
+            allowed_sort_fields=cls.ALLOWED_SORT_FIELDS,
+            fields=fields,
+        )
+
+    @classmethod
+    def get(cls, document_id: str, token: Token, breadcrumb: Mapping[str, Any]) -> Document:
+        """
+        Retrieve a specific document by ID.
+
+        Args:
+            document_id: The document ID to retrieve
+            token: Token dictionary with user_id and roles
+            breadcrumb: Breadcrumb dictionary for logging
+
+        Returns:
+            dict: The document
+
+        Raises:
+            HTTPNotFound: If the document is not found
+        """
+        try:
+            cls._check_permission(token, 'read')
+
+            collection_name = cls._collection_name()
+            document = document_cache.get(collection_name, document_id)
+            if document is None:
+                # Stamp before the read so a concurrent update's invalidate wins
+                generation = document_cache.generation()
+                mongo, _ = _bindings()
+                document = mongo.get_document(collection_name, document_id)
+                if document is None:
+                    raise HTTPNotFound(f"{cls.ENTITY.capitalize()} {document_id} not found")
+                document_cache.put(collection_name, document_id, document, generation)
+
+            logger.debug("Retrieved %s %s for user %s", cls.ENTITY, document_id, token.get('user_id'))
+            return document
+        except HTTPNotFound:
+            raise
+        except Exception as e:
+            logger.error("Error retrieving %s %s: %s", cls.ENTITY, document_id, e)
+            raise HTTPInternalServerError(f"Failed to retrieve {cls.ENTITY} {document_id}")
+
+    @classmethod
+    def update(cls, document_id: str, data: Document, token: Token, breadcrumb: Document) -> Document:
+        """
+        Update a document.
+
+        Args:
+            document_id: The document ID to update
+            data: Dictionary containing fields to update
+            token: Token dictionary with user_id and roles
+            breadcrumb: Breadcrumb dictionary for logging
+
+        Returns:
+            dict: The updated document
+
+        Raises:
+            HTTPNotFound: If the document is not found
+        """
+        try:
+            cls._check_permission(token, 'update')
+            cls._validate_update_data(data)
+
+            # Build update data with $set operator (excluding restricted fields)
+            set_data = dict(data)
+            for field in _RESTRICTED_FIELDS:
+                set_data.pop(field, None)
+
+            # Automatically update the 'saved' field with current breadcrumb (system-managed)
+            # Use breadcrumb directly as it already has the correct structure
+            set_data['saved'] = breadcrumb
+
+            mongo, _ = _bindings()
+            collection_name = cls._collection_name()
+            updated = mongo.update_document(
+                collection_name,
+                document_id=document_id,
+                set_data=set_data
+            )
+
+            if updated is None:
+                raise HTTPNotFound(f"{cls.ENTITY.capitalize()} {document_id} not found")
+
+            document_cache.invalidate(collection_name, document_id)
+            list_cache.invalidate(cls._list_cache_prefix)
+            logger.info("Updated %s %s for user %s", cls.ENTITY, document_id, token.get('user_id'))
+            return updated
+        except (HTTPForbidden, HTTPNotFound):
+            raise
+        except Exception as e:
+            logger.error("Error updating %s %s: %s", cls.ENTITY, document_id, e)
+            raise HTTPInternalServerError(f"Failed to update {cls.ENTITY} {document_id}")
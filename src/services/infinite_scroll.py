@@ -0,0 +1,163 @@
+"""
+Infinite scroll query for list endpoints.
+
+Same contract as api_utils.mongo_utils.execute_infinite_scroll_query, with
+the MongoDB filter built so it can use the indexes the services create.
+"""
+import re
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ASCENDING, DESCENDING
+from api_utils.flask_utils.exceptions import HTTPBadRequest
+
+# Maximum items returned per batch
+MAX_LIMIT = 100
+
+# Plain, optionally dotted, field path (no $ operators or empty segments)
+_FIELD_PATH = re.compile(r'[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*')
+
+
+def validate_infinite_scroll_params(limit, sort_by, order, allowed_sort_fields=None):
+    """
+    Validate infinite scroll paging parameters.
+
+    Cheap enough to call from the route layer so bad requests are rejected
+    before any MongoDB work.
+
+    Args:
+        limit: Items per batch (1-100)
+        sort_by: Field to sort by, must be in allowed_sort_fields
+        order: Sort order ('asc' or 'desc')
+        allowed_sort_fields: Fields that may be used for sort_by
+
+    Raises:
+        HTTPBadRequest: If invalid parameters provided
+    """
+    allowed_sort_fields = allowed_sort_fields or ['name']
+    if limit < 1:
+        raise HTTPBadRequest("limit must be >= 1")
+    if limit > MAX_LIMIT:
+        raise HTTPBadRequest(f"limit must be <= {MAX_LIMIT}")
+    if sort_by not in allowed_sort_fields:
+        raise HTTPBadRequest(f"sort_by must be one of: {', '.join(allowed_sort_fields)}")
+    if order not in ('asc', 'desc'):
+        raise HTTPBadRequest("order must be 'asc' or 'desc'")
+
+
+def parse_fields_param(fields):
+    """
+    Parse a comma separated fields query parameter into projection field names.
+
+    Args:
+        fields: Raw parameter value, e.g. 'name,status' (None or empty for whole documents)
+
+    Returns:
+        tuple|None: Sorted, de-duplicated field names, or None for whole documents
+
+    Raises:
+        HTTPBadRequest: If a field name is not a plain field path, or one field
+            is inside another (MongoDB rejects the projection as a path collision)
+    """
+    if not fields:
+        return None
+    names = sorted({field.strip() for field in fields.split(',')} - {''})
+    for field in names:
+        if not _FIELD_PATH.fullmatch(field):
+            raise HTTPBadRequest(f"fields contains an invalid field name: {field}")
+    for field in names:
+        parts = field.split('.')
+        for depth in range(1, len(parts)):
+            parent = '.'.join(parts[:depth])
+            if parent in names:
+                raise HTTPBadRequest(f"fields contains overlapping paths: {parent}, {field}")
+    return tuple(names) or None
+
+
+def execute_infinite_scroll_query(collection, name=None, after_id=None, limit=10,
+                                  sort_by='name', order='asc', allowed_sort_fields=None,
+                                  fields=None):
+    """
+    Get one infinite scroll batch of sorted, filtered documents.
+
+    Args:
+        collection: PyMongo collection to query
+        name: Optional case-insensitive name prefix filter
+        after_id: Cursor (ID of last item from previous batch, None for first request)
+        limit: Items per batch (1-100)
+        sort_by: Field to sort by, must be in allowed_sort_fields
+        order: Sort order ('asc' or 'desc')
+        allowed_sort_fields: Fields that may be used for sort_by
+        fields: Optional field names to return (projection); _id is always included
+
+    Returns:
+        dict: {
+            'items': [...],
+            'limit': int,
+            'has_more': bool,
+            'next_cursor': str|None  # ID of last item, or None if no more
+        }
+
+    Raises:
+        HTTPBadRequest: If invalid parameters provided
+    """
+    validate_infinite_scroll_params(limit, sort_by, order, allowed_sort_fields)
+
+    direction = ASCENDING if order == 'asc' else DESCENDING
+    query = {}
+    if name:
+        # Case-insensitive prefix match. Only case-sensitive prefix regexes get
+        # tight index bounds, so at best this scans every key in the name index
+        query['name'] = {'$regex': f"^{re.escape(name)}", '$options': 'i'}
+    if after_id:
+        try:
+            cursor_id = ObjectId(after_id)
+        except (InvalidId, TypeError):
+            raise HTTPBadRequest("after_id must be a valid MongoDB ObjectId")
+        anchor = collection.find_one({'_id': cursor_id}, {sort_by: 1})
+        if anchor is None:
+            raise HTTPBadRequest("after_id must reference an existing document")
+        query['$or'] = _keyset_conditions(sort_by, _get_field(anchor, sort_by), cursor_id, direction)
+
+    # Fetch one extra document to detect whether another batch exists, and size the
+    # cursor batch to match so the whole page arrives in a single round-trip
+    projection = dict.fromkeys(fields, 1) if fields else None
+    documents = list(collection.find(
+        query,
+        projection,
+        sort=[(sort_by, direction), ('_id', direction)],
+        limit=limit + 1,
+        batch_size=limit + 1,
+    ))
+    has_more = len(documents) > limit
+    items = documents[:limit]
+    return {
+        'items': items,
+        'limit': limit,
+        'has_more': has_more,
+        'next_cursor': str(items[-1]['_id']) if has_more else None,
+    }
+
+
+def _get_field(document, path):
+    """Read a dotted field path (e.g. 'created.at_time') from a document."""
+    value = document
+    for part in path.split('.'):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+def _keyset_conditions(sort_by, value, cursor_id, direction):
+    """
+    Build the $or conditions selecting documents after the cursor document.
+
+    Documents after (value, cursor_id) in (sort_by, _id) order are those with a
+    greater sort value, or an equal sort value and a greater _id (reversed for
+    descending). This is an index range seek on the (sort_by, _id) index rather
+    than a scan-and-skip. Missing/null values sort before everything else.
+    """
+    op = '$gt' if direction == ASCENDING else '$lt'
+    tie = {sort_by: value, '_id': {op: cursor_id}}
+    if value is None:
+        return [tie, {sort_by: {'$ne': None}}] if direction == ASCENDING else [tie]
+    after = {sort_by: {op: value}}
+    return [after, tie] if direction == ASCENDING else [after, tie, {sort_by: None}]
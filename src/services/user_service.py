@@ -3,239 +3,63 @@ User service for business logic and RBAC.
 
 Handles RBAC checks and MongoDB operations for User domain.
 """
-from api_utils import MongoIO, Config
-from api_utils.flask_utils.exceptions import HTTPBadRequest, HTTPForbidden, HTTPNotFound, HTTPInternalServerError
-from api_utils.mongo_utils import execute_infinite_scroll_query
-import logging
-
-logger = logging.getLogger(__name__)
+from collections.abc import Mapping
+from typing import Any, Optional
+from src.services.crud_service import CrudService, Document, Token
 
 # Allowed sort fields for User domain
 ALLOWED_SORT_FIELDS = ['name', 'description', 'status', 'created.at_time', 'saved.at_time']
 
 
-class UserService:
+class UserService(CrudService):
     """
     Service class for User domain operations.
     
-    Handles:
-    - RBAC authorization checks (placeholder for future implementation)
-    - MongoDB operations via MongoIO singleton
-    - Business logic for User domain
+    The CRUD operations are implemented by CrudService; this class binds them
+    to the user collection and keeps the user-named entry points.
     """
+    ENTITY = 'user'
+    COLLECTION_SETTING = 'USER_COLLECTION_NAME'
+    ALLOWED_SORT_FIELDS = ALLOWED_SORT_FIELDS
     
-    @staticmethod
-    def _check_permission(token, operation):
-        """
-        Check if the user has permission to perform an operation.
-        
-        Args:
-            token: Token dictionary with user_id and roles
-            operation: The operation being performed (e.g., 'read', 'create', 'update')
-        
-        Raises:
-            HTTPForbidden: If user doesn't have required permission
-            
-        Note: This is a placeholder for future RBAC implementation.
-        For now, all operations require a valid token (authentication only).
-        
-        Example RBAC implementation:
-            if operation == 'update':
-                # Update requires admin role
-                if 'admin' not in token.get('roles', []):
-                    raise HTTPForbidden("Admin role required to update user documents")
-            elif operation == 'create':
-                # Create requires staff or admin role
-                if not any(role in token.get('roles', []) for role in ['staff', 'admin']):
-                    raise HTTPForbidden("Staff or admin role required to create user documents")
-            elif operation == 'read':
-                # Read requires any authenticated user (no additional check needed)
-                pass
-        """
-        pass
-    
-    @staticmethod
-    def _validate_update_data(data):
-        """
-        Validate update data to prevent security issues.
-        
-        Args:
-            data: Dictionary of fields to update
-            
-        Raises:
-            HTTPForbidden: If update data contains restricted fields
-        """
-        # Prevent updates to _id and system-managed fields
-        restricted_fields = ['_id', 'created', 'saved']
-        for field in restricted_fields:
-            if field in data:
-                raise HTTPForbidden(f"Cannot update {field} field")
-    
-    @staticmethod
-    def create_user(data, token, breadcrumb):
+    @classmethod
+    def create_user(cls, data: Document, token: Token, breadcrumb: Document) -> Document:
         """
         Create a new user document.
         
-        Args:
-            data: Dictionary containing user data
-            token: Token dictionary with user_id and roles
-            breadcrumb: Breadcrumb dictionary for logging (contains at_time, by_user, from_ip, correlation_id)
-            
         Returns:
-            str: The ID of the created user document
+            dict: The created user document including _id
         """
-        try:
-            UserService._check_permission(token, 'create')
-            
-            # Remove _id if present (MongoDB will generate it)
-            if '_id' in data:
-                del data['_id']
-            
-            # Automatically populate required fields: created and saved
-            # These are system-managed and should not be provided by the client
-            # Use breadcrumb directly as it already has the correct structure
-            data['created'] = breadcrumb
-            data['saved'] = breadcrumb
-            
-            mongo = MongoIO.get_instance()
-            config = Config.get_instance()
-            user_id = mongo.create_document(config.USER_COLLECTION_NAME, data)
-            logger.info(f"Created user { user_id} for user {token.get('user_id')}")
-            return user_id
-        except HTTPForbidden:
-            raise
-        except Exception as e:
-            error_msg = str(e)
-            logger.error(f"Error creating user: {error_msg}")
-            raise HTTPInternalServerError(f"Failed to create user: {error_msg}")
+        return cls.create(data, token, breadcrumb)
     
-    @staticmethod
-    def get_users(token, breadcrumb, name=None, after_id=None, limit=10, sort_by='name', order='asc'):
+    @classmethod
+    def get_users(cls, token: Token, breadcrumb: Mapping[str, Any], name: Optional[str] = None,
+                  after_id: Optional[str] = None, limit: int = 10, sort_by: str = 'name', order: str = 'asc',
+                  fields: Optional[tuple[str, ...]] = None) -> dict[str, Any]:
         """
         Get infinite scroll batch of sorted, filtered user documents.
         
-        Args:
-            token: Authentication token
-            breadcrumb: Audit breadcrumb
-            name: Optional name filter (simple search)
-            after_id: Cursor (ID of last item from previous batch, None for first request)
-            limit: Items per batch
-            sort_by: Field to sort by
-            order: Sort order ('asc' or 'desc')
-        
-        Returns:
-            dict: {
-                'items': [...],
-                'limit': int,
-                'has_more': bool,
-                'next_cursor': str|None  # ID of last item, or None if no more
-            }
-        
-        Raises:
-            HTTPBadRequest: If invalid parameters provided
+        See CrudService.get_many for the arguments and result shape.
         """
-        try:
-            UserService._check_permission(token, 'read')
-            mongo = MongoIO.get_instance()
-            config = Config.get_instance()
-            collection = mongo.get_collection(config.USER_COLLECTION_NAME)
-            result = execute_infinite_scroll_query(
-                collection,
-                name=name,
-                after_id=after_id,
-                limit=limit,
-                sort_by=sort_by,
-                order=order,
-                allowed_sort_fields=ALLOWED_SORT_FIELDS,
-            )
-            logger.info(
-                f"Retrieved {len(result['items'])} users (has_more={result['has_more']}) "
-                f"for user {token.get('user_id')}"
-            )
-            return result
-        except HTTPBadRequest:
-            raise
-        except Exception as e:
-            logger.error(f"Error retrieving users: {str(e)}")
-            raise HTTPInternalServerError("Failed to retrieve users")
+        return cls.get_many(token, breadcrumb, name=name, after_id=after_id, limit=limit, sort_by=sort_by, order=order,
+                            fields=fields)
     
-    @staticmethod
-    def get_user(user_id, token, breadcrumb):
+    @classmethod
+    def get_user(cls, user_id: str, token: Token, breadcrumb: Mapping[str, Any]) -> Document:
         """
         Retrieve a specific user document by ID.
         
-        Args:
-            user_id: The user ID to retrieve
-            token: Token dictionary with user_id and roles
-            breadcrumb: Breadcrumb dictionary for logging
-            
-        Returns:
-            dict: The user document
-            
         Raises:
             HTTPNotFound: If user is not found
         """
-        try:
-            UserService._check_permission(token, 'read')
-            
-            mongo = MongoIO.get_instance()
-            config = Config.get_instance()
-            user = mongo.get_document(config.USER_COLLECTION_NAME, user_id)
-            if user is None:
-                raise HTTPNotFound(f"User { user_id} not found")
-            
-            logger.info(f"Retrieved user { user_id} for user {token.get('user_id')}")
-            return user
-        except HTTPNotFound:
-            raise
-        except Exception as e:
-            logger.error(f"Error retrieving user { user_id}: {str(e)}")
-            raise HTTPInternalServerError(f"Failed to retrieve user { user_id}")
+        return cls.get(user_id, token, breadcrumb)
     
-    @staticmethod
-    def update_user(user_id, data, token, breadcrumb):
+    @classmethod
+    def update_user(cls, user_id: str, data: Document, token: Token, breadcrumb: Document) -> Document:
         """
         Update a user document.
         
-        Args:
-            user_id: The user ID to update
-            data: Dictionary containing fields to update
-            token: Token dictionary with user_id and roles
-            breadcrumb: Breadcrumb dictionary for logging
-            
-        Returns:
-            dict: The updated user document
-            
         Raises:
             HTTPNotFound: If user is not found
         """
-        try:
-            UserService._check_permission(token, 'update')
-            UserService._validate_update_data(data)
-            
-            # Build update data with $set operator (excluding restricted fields)
-            restricted_fields = ['_id', 'created', 'saved']
-            set_data = {k: v for k, v in data.items() if k not in restricted_fields}
-            
-            # Automatically update the 'saved' field with current breadcrumb (system-managed)
-            # Use breadcrumb directly as it already has the correct structure
-            set_data['saved'] = breadcrumb
-            
-            mongo = MongoIO.get_instance()
-            config = Config.get_instance()
-            updated = mongo.update_document(
-                config.USER_COLLECTION_NAME,
-                document_id=user_id,
-                set_data=set_data
-            )
-            
-            if updated is None:
-                raise HTTPNotFound(f"User { user_id} not found")
-            
-            logger.info(f"Updated user { user_id} for user {token.get('user_id')}")
-            return updated
-        except (HTTPForbidden, HTTPNotFound):
-            raise
-        except Exception as e:
-            logger.error(f"Error updating user { user_id}: {str(e)}")
-            raise HTTPInternalServerError(f"Failed to update user { user_id}")
\ No newline at end of file
+        return cls.update(user_id, data, token, breadcrumb)
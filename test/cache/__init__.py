@@ -0,0 +1,2 @@
+# Test cache package
+
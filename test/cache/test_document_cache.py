@@ -0,0 +1,91 @@
+"""
+Unit tests for the single-document cache.
+"""
+import unittest
+from prometheus_client import REGISTRY
+from src.cache import document_cache
+
+
+class TestDocumentCache(unittest.TestCase):
+    """Test cases for document_cache."""
+
+    def setUp(self):
+        """Start every test with an empty cache."""
+        document_cache.clear()
+
+    def _count(self, metric, collection):
+        value = REGISTRY.get_sample_value(metric, {"collection": collection})
+        return value or 0
+
+    def test_get_miss_returns_none(self):
+        """Test a miss returns None and counts the miss."""
+        misses = self._count("document_cache_misses_total", "Test")
+
+        self.assertIsNone(document_cache.get("Test", "123"))
+        self.assertEqual(self._count("document_cache_misses_total", "Test"), misses + 1)
+
+    def _put(self, document_id, document):
+        generation = document_cache.generation()
+        document_cache.put("Test", document_id, document, generation)
+
+    def test_put_then_get(self):
+        """Test a cached document is returned and counts the hit."""
+        hits = self._count("document_cache_hits_total", "Test")
+        document = {"_id": "123", "name": "test"}
+
+        self._put("123", document)
+
+        self.assertEqual(document_cache.get("Test", "123"), document)
+        self.assertEqual(self._count("document_cache_hits_total", "Test"), hits + 1)
+
+    def test_get_returns_a_copy(self):
+        """Test callers can't change the cached document through put or get."""
+        document = {"_id": "123", "saved": {"at_time": "t1"}}
+        self._put("123", document)
+        document["saved"]["at_time"] = "t2"
+
+        cached = document_cache.get("Test", "123")
+        cached["saved"]["at_time"] = "t3"
+
+        self.assertEqual(document_cache.get("Test", "123")["saved"]["at_time"], "t1")
+
+    def test_put_skips_fill_started_before_invalidate(self):
+        """Test a read that raced an update doesn't cache the old document."""
+        generation = document_cache.generation()
+        document_cache.invalidate("Test", "123")
+
+        document_cache.put("Test", "123", {"_id": "123"}, generation)
+
+        self.assertIsNone(document_cache.get("Test", "123"))
+        self._put("123", {"_id": "123"})
+        self.assertIsNotNone(document_cache.get("Test", "123"))
+
+    def test_put_skips_fill_started_before_clear(self):
+        """Test clear also drops fills that were in flight."""
+        generation = document_cache.generation()
+        document_cache.clear()
+
+        document_cache.put("Test", "123", {"_id": "123"}, generation)
+
+        self.assertIsNone(document_cache.get("Test", "123"))
+
+    def test_keys_include_collection(self):
+        """Test the same ID in different collections is cached separately."""
+        self._put("123", {"_id": "123"})
+
+        self.assertIsNone(document_cache.get("Other", "123"))
+
+    def test_invalidate(self):
+        """Test invalidate drops only the given document."""
+        self._put("123", {"_id": "123"})
+        self._put("456", {"_id": "456"})
+
+        document_cache.invalidate("Test", "123")
+        document_cache.invalidate("Test", "999")
+
+        self.assertIsNone(document_cache.get("Test", "123"))
+        self.assertIsNotNone(document_cache.get("Test", "456"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Unit tests for the infinite scroll list cache.
+"""
+import unittest
+from unittest.mock import MagicMock
+from src.cache import list_cache
+
+
+class TestListCache(unittest.TestCase):
+    """Test cases for list_cache."""
+
+    def setUp(self):
+        """Start every test with empty caches."""
+        list_cache.clear()
+        self.query = MagicMock(return_value={"items": [], "has_more": False})
+        self.cached_query = list_cache.cached("test_items")(self.query)
+
+    def test_cached_returns_stored_result(self):
+        """Test repeated calls with the same kwargs hit the cache."""
+        first = self.cached_query(name="a", limit=10)
+        second = self.cached_query(limit=10, name="a")
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.query.assert_called_once_with(name="a", limit=10)
+
+    def test_cached_result_is_not_shared(self):
+        """Test changing a returned batch doesn't change later cache hits."""
+        self.cached_query(name="a")["items"].append({"_id": "1"})
+        hit = self.cached_query(name="a")
+        hit["items"].append({"_id": "2"})
+
+        self.assertEqual(self.cached_query(name="a")["items"], [])
+
+    def test_cached_keys_on_kwargs(self):
+        """Test different kwargs are cached separately."""
+        self.cached_query(name="a", limit=10)
+        self.cached_query(name="b", limit=10)
+
+        self.assertEqual(self.query.call_count, 2)
+
+    def test_cached_does_not_store_exceptions(self):
+        """Test a failing query is retried on the next call."""
+        self.query.side_effect = [Exception("Database error"), {"items": []}]
+
+        with self.assertRaises(Exception):
+            self.cached_query(name="a")
+        result = self.cached_query(name="a")
+
+        self.assertEqual(result, {"items": []})
+        self.assertEqual(self.query.call_count, 2)
+
+    def test_invalidate_clears_prefix(self):
+        """Test invalidate drops cached results for the prefix only."""
+        other_query = MagicMock(return_value={"items": []})
+        cached_other = list_cache.cached("other_items")(other_query)
+        self.cached_query(name="a")
+        cached_other(name="a")
+
+        list_cache.invalidate("test_items")
+        self.cached_query(name="a")
+        cached_other(name="a")
+
+        self.assertEqual(self.query.call_count, 2)
+        other_query.assert_called_once()
+
+    def test_invalidate_during_query_skips_store(self):
+        """Test a result read before a concurrent invalidate isn't cached."""
+
+        def query(**kwargs):
+            list_cache.invalidate("test_items")
+            return {"items": [], "has_more": False}
+
+        self.query.side_effect = query
+        self.cached_query(name="a")
+        self.query.side_effect = None
+        self.cached_query(name="a")
+        self.cached_query(name="a")
+
+        self.assertEqual(self.query.call_count, 2)
+
+    def test_cached_rejects_conflicting_settings(self):
+        """Test re-registering a prefix with different settings raises."""
+        list_cache.cached("test_items")(self.query)
+
+        with self.assertRaises(ValueError):
+            list_cache.cached("test_items", ttl=60)(self.query)
+
+    def test_invalidate_unknown_prefix(self):
+        """Test invalidating an unused prefix is a no-op."""
+        list_cache.invalidate("unknown")
+
+    def test_expired_results_are_refreshed(self):
+        """Test results are re-queried once the TTL has passed."""
+        cached_query = list_cache.cached("short_lived", ttl=0)(self.query)
+        cached_query(name="a")
+        cached_query(name="a")
+
+        self.assertEqual(self.query.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
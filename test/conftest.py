@@ -0,0 +1,25 @@
+"""
+Shared pytest fixtures for the whole test suite.
+"""
+from types import MappingProxyType
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def token():
+    """Read-only admin token, shared by every test in the session."""
+    return MappingProxyType({"user_id": "test_user", "roles": ("admin",)})
+
+
+@pytest.fixture(scope="session")
+def breadcrumb():
+    """Read-only breadcrumb, shared by every test in the session."""
+    return MappingProxyType(
+        {
+            "at_time": "2024-01-01T00:00:00Z",
+            "by_user": "test_user",
+            "from_ip": "127.0.0.1",
+            "correlation_id": "test-correlation-id",
+        }
+    )
@@ -0,0 +1,32 @@
+"""
+Shared pytest fixtures for route tests.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+from src.services.user_service import UserService
+
+from .test_platform_routes import _APP, _CLIENT
+
+# One UserService double for the whole session; the fixture resets it.
+_user_service = MagicMock(spec=UserService)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The route-test Flask app, shared with test_platform_routes."""
+    return _APP
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """The route-test client, shared with test_platform_routes."""
+    return _CLIENT
+
+
+@pytest.fixture
+def user_service(monkeypatch):
+    """The shared UserService mock, installed on the routes module for one test."""
+    monkeypatch.setattr("src.routes.user_routes.UserService", _user_service)
+    yield _user_service
+    _user_service.reset_mock(return_value=True, side_effect=True)
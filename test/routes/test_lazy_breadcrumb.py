@@ -0,0 +1,43 @@
+"""
+Unit tests for LazyBreadcrumb.
+"""
+import unittest
+from unittest.mock import MagicMock
+from src.routes.lazy_breadcrumb import LazyBreadcrumb
+
+
+class TestLazyBreadcrumb(unittest.TestCase):
+    """Test cases for LazyBreadcrumb."""
+
+    def setUp(self):
+        """Set up a breadcrumb factory mock."""
+        self.token = {"user_id": "test_user", "roles": ["admin"]}
+        self.breadcrumb = {"at_time": "sometime", "correlation_id": "correlation_ID"}
+        self.factory = MagicMock(return_value=self.breadcrumb)
+
+    def test_not_built_until_read(self):
+        """Test the factory is not called on construction."""
+        LazyBreadcrumb(self.factory, self.token)
+
+        self.factory.assert_not_called()
+
+    def test_built_once_on_first_read(self):
+        """Test the factory is called once with the token."""
+        lazy = LazyBreadcrumb(self.factory, self.token)
+
+        self.assertEqual(lazy["at_time"], "sometime")
+        self.assertEqual(lazy["correlation_id"], "correlation_ID")
+        self.factory.assert_called_once_with(self.token)
+
+    def test_behaves_like_breadcrumb_dict(self):
+        """Test mapping behaviour matches the built breadcrumb."""
+        lazy = LazyBreadcrumb(self.factory, self.token)
+
+        self.assertEqual(lazy, self.breadcrumb)
+        self.assertEqual(len(lazy), 2)
+        self.assertEqual(dict(lazy), self.breadcrumb)
+        self.assertIsNone(lazy.get("missing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,23 +9,32 @@ import unittest
 from unittest.mock import patch
 from flask import Flask
 from src.routes.platform_routes import create_platform_routes
+from src.routes.user_routes import create_user_routes
+
+# The one route-test app, built once at import with every blueprint; the
+# session fixtures in conftest.py hand the same app and client to the user
+# route tests, and it still works when this file is run with unittest
+_APP = Flask(__name__)
+_APP.register_blueprint(create_platform_routes(), url_prefix="/api/platform")
+_APP.register_blueprint(create_user_routes(), url_prefix="/api/user")
+_CLIENT = _APP.test_client()
 
 
 class TestPlatformRoutes(unittest.TestCase):
     """Test cases for Platform routes."""
 
-    def setUp(self):
-        """Set up the Flask test client and app context."""
-        self.app = Flask(__name__)
-        self.app.register_blueprint(
-            create_platform_routes(),
-            url_prefix="/api/platform",
-        )
-        self.client = self.app.test_client()
+    app = _APP
+    client = _CLIENT
 
+    def setUp(self):
+        """Set up per-test token and breadcrumb fixtures."""
         self.mock_token = {"user_id": "test_user", "roles": ["admin"]}
         self.mock_breadcrumb = {"at_time": "sometime", "correlation_id": "correlation_ID"}
 
+    def test_create_platform_routes_is_memoized(self):
+        """Test the Blueprint factory returns the same Blueprint on every call."""
+        self.assertIs(create_platform_routes(), create_platform_routes())
+
     @patch("src.routes.platform_routes.create_flask_token")
     @patch("src.routes.platform_routes.create_flask_breadcrumb")
     @patch("src.routes.platform_routes.PlatformService.create_platform")
@@ -37,12 +46,11 @@ class TestPlatformRoutes(unittest.TestCase):
         mock_create_breadcrumb,
         mock_create_token,
     ):
-        """Test POST /api/platform for successful creation."""
+        """Test POST /api/platform returns the created document without re-reading it."""
         mock_create_token.return_value = self.mock_token
         mock_create_breadcrumb.return_value = self.mock_breadcrumb
 
-        mock_create_platform.return_value = "123"
-        mock_get_platform.return_value = {
+        mock_create_platform.return_value = {
             "_id": "123",
             "name": "test-platform",
             "status": "active",
@@ -57,9 +65,7 @@ class TestPlatformRoutes(unittest.TestCase):
         data = response.json
         self.assertEqual(data["_id"], "123")
         mock_create_platform.assert_called_once()
-        mock_get_platform.assert_called_once_with(
-            "123", self.mock_token, self.mock_breadcrumb
-        )
+        mock_get_platform.assert_not_called()
 
     @patch("src.routes.platform_routes.create_flask_token")
     @patch("src.routes.platform_routes.create_flask_breadcrumb")
@@ -99,6 +105,7 @@ class TestPlatformRoutes(unittest.TestCase):
             limit=10,
             sort_by="name",
             order="asc",
+            fields=None,
         )
 
     @patch("src.routes.platform_routes.create_flask_token")
@@ -136,8 +143,71 @@ class TestPlatformRoutes(unittest.TestCase):
             limit=10,
             sort_by="name",
             order="asc",
+            fields=None,
         )
 
+    @patch("src.routes.platform_routes.create_flask_token")
+    @patch("src.routes.platform_routes.create_flask_breadcrumb")
+    @patch("src.routes.platform_routes.PlatformService.get_platforms")
+    def test_get_platforms_with_fields(
+        self,
+        mock_get_platforms,
+        mock_create_breadcrumb,
+        mock_create_token,
+    ):
+        """Test GET /api/platform passes the parsed fields projection."""
+        mock_create_token.return_value = self.mock_token
+        mock_create_breadcrumb.return_value = self.mock_breadcrumb
+        mock_get_platforms.return_value = {
+            "items": [{"_id": "123", "name": "test-platform"}],
+            "limit": 10,
+            "has_more": False,
+            "next_cursor": None,
+        }
+
+        response = self.client.get("/api/platform?fields=status,name")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            mock_get_platforms.call_args.kwargs["fields"], ("name", "status")
+        )
+
+        response = self.client.get("/api/platform?fields=$where")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fields contains an invalid field name", response.json["error"])
+
+        response = self.client.get("/api/platform?fields=created,created.at_time")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fields contains overlapping paths", response.json["error"])
+
+    @patch("src.routes.platform_routes.create_flask_token")
+    @patch("src.routes.platform_routes.create_flask_breadcrumb")
+    @patch("src.routes.platform_routes.PlatformService.get_platforms")
+    def test_get_platforms_invalid_params_rejected_in_route(
+        self,
+        mock_get_platforms,
+        mock_create_breadcrumb,
+        mock_create_token,
+    ):
+        """Test GET /api/platform rejects bad paging parameters before the service."""
+        mock_create_token.return_value = self.mock_token
+        mock_create_breadcrumb.return_value = self.mock_breadcrumb
+
+        for query, message in [
+            ("limit=0", "limit must be >= 1"),
+            ("limit=101", "limit must be <= 100"),
+            ("sort_by=invalid_field", "sort_by must be one of"),
+            ("order=invalid", "order must be 'asc' or 'desc'"),
+        ]:
+            with self.subTest(query=query):
+                response = self.client.get(f"/api/platform?{query}")
+
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(message, response.json["error"])
+        mock_get_platforms.assert_not_called()
+
     @patch("src.routes.platform_routes.create_flask_token")
     @patch("src.routes.platform_routes.create_flask_breadcrumb")
     @patch("src.routes.platform_routes.PlatformService.get_platform")
@@ -165,6 +235,61 @@ class TestPlatformRoutes(unittest.TestCase):
             "123", self.mock_token, self.mock_breadcrumb
         )
 
+    @patch("src.routes.platform_routes.create_flask_token")
+    @patch("src.routes.platform_routes.create_flask_breadcrumb")
+    @patch("src.routes.platform_routes.PlatformService.get_platform")
+    def test_get_platform_does_not_build_breadcrumb(
+        self,
+        mock_get_platform,
+        mock_create_breadcrumb,
+        mock_create_token,
+    ):
+        """Test GET /api/platform/<id> skips breadcrumb creation for reads."""
+        mock_create_token.return_value = self.mock_token
+        mock_get_platform.return_value = {"_id": "123", "name": "platform1"}
+
+        response = self.client.get("/api/platform/123")
+
+        self.assertEqual(response.status_code, 200)
+        mock_create_breadcrumb.assert_not_called()
+
+    @patch("src.routes.platform_routes.create_flask_token")
+    @patch("src.routes.platform_routes.create_flask_breadcrumb")
+    @patch("src.routes.platform_routes.PlatformService.get_platform")
+    def test_get_platform_conditional_get(
+        self,
+        mock_get_platform,
+        mock_create_breadcrumb,
+        mock_create_token,
+    ):
+        """Test GET /api/platform/<id> returns an ETag and honours If-None-Match."""
+        mock_create_token.return_value = self.mock_token
+        platform = {"_id": "123", "name": "platform1", "saved": {"at_time": "t1"}}
+        mock_get_platform.return_value = platform
+
+        response = self.client.get("/api/platform/123")
+        etag = response.headers["ETag"]
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(etag)
+
+        response = self.client.get(
+            "/api/platform/123", headers={"If-None-Match": etag}
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+
+        platform["saved"] = {"at_time": "t2"}
+        response = self.client.get(
+            "/api/platform/123", headers={"If-None-Match": etag}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertEqual(response.json["name"], "platform1")
+
     @patch("src.routes.platform_routes.create_flask_token")
     @patch("src.routes.platform_routes.create_flask_breadcrumb")
     @patch("src.routes.platform_routes.PlatformService.get_platform")
@@ -204,6 +329,35 @@ class TestPlatformRoutes(unittest.TestCase):
         self.assertEqual(response.status_code, 401)
         self.assertIn("error", response.json)
 
+    @patch("src.routes.platform_routes.create_flask_token")
+    @patch("src.routes.platform_routes.PlatformService.get_platforms")
+    def test_get_platforms_unauthorized_skips_handler(
+        self, mock_get_platforms, mock_create_token
+    ):
+        """Test the before_request hook rejects a bad token before the handler runs."""
+        from api_utils.flask_utils.exceptions import HTTPUnauthorized
+
+        mock_create_token.side_effect = HTTPUnauthorized("Invalid token")
+
+        response = self.client.get("/api/platform")
+
+        self.assertEqual(response.status_code, 401)
+        self.assertIn("error", response.json)
+        mock_get_platforms.assert_not_called()
+
+    @patch("src.routes.platform_routes.create_flask_token")
+    def test_options_needs_no_token(self, mock_create_token):
+        """Test OPTIONS is answered by Flask without authenticating."""
+        from api_utils.flask_utils.exceptions import HTTPUnauthorized
+
+        mock_create_token.side_effect = HTTPUnauthorized("Invalid token")
+
+        response = self.client.options("/api/platform")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("OPTIONS", response.headers["Allow"])
+        mock_create_token.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
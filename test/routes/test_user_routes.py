@@ -3,207 +3,264 @@ Unit tests for User routes.
 
 These tests validate the Flask route layer for the User domain, using the
 generated blueprint factory and mocking out the underlying service and
-token/breadcrumb helpers from api_utils.
+token/breadcrumb helpers from api_utils. The Flask app, client, token and
+breadcrumb come from the session fixtures in conftest.py.
 """
-import unittest
-from unittest.mock import patch
-from flask import Flask
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call
+
+import pytest
+from api_utils.flask_utils.exceptions import HTTPNotFound, HTTPUnauthorized
+
+import src.routes.user_routes as user_routes
 from src.routes.user_routes import create_user_routes
 
 
-class TestUserRoutes(unittest.TestCase):
-    """Test cases for User routes."""
-
-    def setUp(self):
-        """Set up the Flask test client and app context."""
-        self.app = Flask(__name__)
-        self.app.register_blueprint(
-            create_user_routes(),
-            url_prefix="/api/user",
-        )
-        self.client = self.app.test_client()
-
-        self.mock_token = {"user_id": "test_user", "roles": ["admin"]}
-        self.mock_breadcrumb = {"at_time": "sometime", "correlation_id": "correlation_ID"}
-
-    @patch("src.routes.user_routes.create_flask_token")
-    @patch("src.routes.user_routes.create_flask_breadcrumb")
-    @patch("src.routes.user_routes.UserService.create_user")
-    @patch("src.routes.user_routes.UserService.get_user")
-    def test_create_user_success(
-        self,
-        mock_get_user,
-        mock_create_user,
-        mock_create_breadcrumb,
-        mock_create_token,
-    ):
-        """Test POST /api/user for successful creation."""
-        mock_create_token.return_value = self.mock_token
-        mock_create_breadcrumb.return_value = self.mock_breadcrumb
-
-        mock_create_user.return_value = "123"
-        mock_get_user.return_value = {
-            "_id": "123",
-            "name": "test-user",
-            "status": "active",
-        }
-
-        response = self.client.post(
-            "/api/user",
-            json={"name": "test-user", "status": "active"},
-        )
-
-        self.assertEqual(response.status_code, 201)
-        data = response.json
-        self.assertEqual(data["_id"], "123")
-        mock_create_user.assert_called_once()
-        mock_get_user.assert_called_once_with(
-            "123", self.mock_token, self.mock_breadcrumb
-        )
-
-    @patch("src.routes.user_routes.create_flask_token")
-    @patch("src.routes.user_routes.create_flask_breadcrumb")
-    @patch("src.routes.user_routes.UserService.get_users")
-    def test_get_users_no_filter(
-        self,
-        mock_get_users,
-        mock_create_breadcrumb,
-        mock_create_token,
-    ):
-        """Test GET /api/user without name filter."""
-        mock_create_token.return_value = self.mock_token
-        mock_create_breadcrumb.return_value = self.mock_breadcrumb
-
-        mock_get_users.return_value = {
-            "items": [
-                {"_id": "123", "name": "user1"},
-                {"_id": "456", "name": "user2"},
-            ],
-            "limit": 10,
-            "has_more": False,
-            "next_cursor": None,
-        }
-
-        response = self.client.get("/api/user")
-
-        self.assertEqual(response.status_code, 200)
-        data = response.json
-        self.assertIsInstance(data, dict)
-        self.assertIn("items", data)
-        self.assertEqual(len(data["items"]), 2)
-        mock_get_users.assert_called_once_with(
-            self.mock_token,
-            self.mock_breadcrumb,
-            name=None,
-            after_id=None,
-            limit=10,
-            sort_by="name",
-            order="asc",
-        )
-
-    @patch("src.routes.user_routes.create_flask_token")
-    @patch("src.routes.user_routes.create_flask_breadcrumb")
-    @patch("src.routes.user_routes.UserService.get_users")
-    def test_get_users_with_name_filter(
-        self,
-        mock_get_users,
-        mock_create_breadcrumb,
-        mock_create_token,
-    ):
-        """Test GET /api/user with name query parameter."""
-        mock_create_token.return_value = self.mock_token
-        mock_create_breadcrumb.return_value = self.mock_breadcrumb
-
-        mock_get_users.return_value = {
-            "items": [{"_id": "123", "name": "test-user"}],
-            "limit": 10,
-            "has_more": False,
-            "next_cursor": None,
-        }
-
-        response = self.client.get("/api/user?name=test")
-
-        self.assertEqual(response.status_code, 200)
-        data = response.json
-        self.assertIsInstance(data, dict)
-        self.assertIn("items", data)
-        self.assertEqual(len(data["items"]), 1)
-        mock_get_users.assert_called_once_with(
-            self.mock_token,
-            self.mock_breadcrumb,
-            name="test",
-            after_id=None,
-            limit=10,
-            sort_by="name",
-            order="asc",
-        )
-
-    @patch("src.routes.user_routes.create_flask_token")
-    @patch("src.routes.user_routes.create_flask_breadcrumb")
-    @patch("src.routes.user_routes.UserService.get_user")
-    def test_get_user_success(
-        self,
-        mock_get_user,
-        mock_create_breadcrumb,
-        mock_create_token,
-    ):
-        """Test GET /api/user/<id> for successful response."""
-        mock_create_token.return_value = self.mock_token
-        mock_create_breadcrumb.return_value = self.mock_breadcrumb
-
-        mock_get_user.return_value = {
-            "_id": "123",
-            "name": "user1",
-        }
-
-        response = self.client.get("/api/user/123")
-
-        self.assertEqual(response.status_code, 200)
-        data = response.json
-        self.assertEqual(data["_id"], "123")
-        mock_get_user.assert_called_once_with(
-            "123", self.mock_token, self.mock_breadcrumb
-        )
-
-    @patch("src.routes.user_routes.create_flask_token")
-    @patch("src.routes.user_routes.create_flask_breadcrumb")
-    @patch("src.routes.user_routes.UserService.get_user")
-    def test_get_user_not_found(
-        self,
-        mock_get_user,
-        mock_create_breadcrumb,
-        mock_create_token,
-    ):
-        """Test GET /api/user/<id> when document is not found."""
-        from api_utils.flask_utils.exceptions import HTTPNotFound
-
-        mock_create_token.return_value = self.mock_token
-        mock_create_breadcrumb.return_value = self.mock_breadcrumb
-
-        mock_get_user.side_effect = HTTPNotFound(
-            "User 999 not found"
-        )
-
-        response = self.client.get("/api/user/999")
-
-        self.assertEqual(response.status_code, 404)
-        self.assertEqual(response.json["error"], "User 999 not found")
-
-    @patch("src.routes.user_routes.create_flask_token")
-    def test_create_user_unauthorized(self, mock_create_token):
-        """Test POST /api/user when token is invalid."""
-        from api_utils.flask_utils.exceptions import HTTPUnauthorized
-
-        mock_create_token.side_effect = HTTPUnauthorized("Invalid token")
-
-        response = self.client.post(
+@pytest.fixture(autouse=True)
+def auth(monkeypatch, token, breadcrumb, user_service):
+    """Replace the token/breadcrumb helpers and UserService on the routes module."""
+    auth = SimpleNamespace(
+        create_token=MagicMock(return_value=token),
+        create_breadcrumb=MagicMock(return_value=breadcrumb),
+    )
+    monkeypatch.setattr(user_routes, "create_flask_token", auth.create_token)
+    monkeypatch.setattr(user_routes, "create_flask_breadcrumb", auth.create_breadcrumb)
+    return auth
+
+
+def test_create_user_routes_is_memoized():
+    """Test the Blueprint factory returns the same Blueprint on every call."""
+    assert create_user_routes() is create_user_routes()
+
+
+@pytest.mark.parametrize(
+    "method,path,payload,service_method,service_arg,expected_status",
+    [
+        (
+            "post",
             "/api/user",
-            json={"name": "test"},
-        )
+            {"name": "test-user", "status": "active"},
+            "create_user",
+            {"name": "test-user", "status": "active"},
+            201,
+        ),
+        ("get", "/api/user/123", None, "get_user", "123", 200),
+    ],
+)
+def test_user_happy_path(
+    client,
+    token,
+    breadcrumb,
+    user_service,
+    method,
+    path,
+    payload,
+    service_method,
+    service_arg,
+    expected_status,
+):
+    """Test POST /api/user and GET /api/user/<id> return the service document."""
+    getattr(user_service, service_method).return_value = {
+        "_id": "123",
+        "name": "test-user",
+        "status": "active",
+    }
+
+    response = client.open(path, method=method, json=payload)
+
+    assert response.status_code == expected_status
+    assert response.json["_id"] == "123"
+    # One service call only: create returns its document without a get re-read
+    assert user_service.method_calls == [
+        getattr(call, service_method)(service_arg, token, breadcrumb)
+    ]
+
+
+@pytest.mark.parametrize(
+    "query_string,expected_name,item_count",
+    [("", None, 2), ("?name=test", "test", 1)],
+)
+def test_get_users(
+    client, token, breadcrumb, user_service, query_string, expected_name, item_count
+):
+    """Test GET /api/user with and without the name query parameter."""
+    user_service.get_users.return_value = {
+        "items": [{"_id": str(i), "name": f"user{i}"} for i in range(item_count)],
+        "limit": 10,
+        "has_more": False,
+        "next_cursor": None,
+    }
+
+    response = client.get("/api/user" + query_string)
+
+    assert response.status_code == 200
+    data = response.json
+    assert isinstance(data, dict)
+    assert len(data["items"]) == item_count
+    user_service.get_users.assert_called_once_with(
+        token,
+        breadcrumb,
+        name=expected_name,
+        after_id=None,
+        limit=10,
+        sort_by="name",
+        order="asc",
+        fields=None,
+    )
+
+
+def test_get_users_with_fields(client, user_service):
+    """Test GET /api/user passes the parsed fields projection."""
+    user_service.get_users.return_value = {
+        "items": [{"_id": "123", "name": "test-user"}],
+        "limit": 10,
+        "has_more": False,
+        "next_cursor": None,
+    }
+
+    response = client.get("/api/user?fields=status,name")
+
+    assert response.status_code == 200
+    assert user_service.get_users.call_args.kwargs["fields"] == ("name", "status")
+
+    response = client.get("/api/user?fields=$where")
+
+    assert response.status_code == 400
+    assert "fields contains an invalid field name" in response.json["error"]
+
+
+def test_get_users_with_overlapping_fields(client, user_service):
+    """Test GET /api/user rejects a projection MongoDB would refuse as a collision."""
+    response = client.get("/api/user?fields=created,created.at_time")
+
+    assert response.status_code == 400
+    assert response.json["error"] == (
+        "fields contains overlapping paths: created, created.at_time"
+    )
+    user_service.get_users.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "query,message",
+    [
+        ("limit=0", "limit must be >= 1"),
+        ("limit=101", "limit must be <= 100"),
+        ("sort_by=invalid_field", "sort_by must be one of"),
+        ("order=invalid", "order must be 'asc' or 'desc'"),
+    ],
+)
+def test_get_users_invalid_params_rejected_in_route(
+    client, user_service, query, message
+):
+    """Test GET /api/user rejects bad paging parameters before the service."""
+    response = client.get(f"/api/user?{query}")
+
+    assert response.status_code == 400
+    assert message in response.json["error"]
+    user_service.get_users.assert_not_called()
+
+
+def test_get_user_does_not_build_breadcrumb(client, user_service, auth):
+    """Test GET /api/user/<id> skips breadcrumb creation for reads."""
+    user_service.get_user.return_value = {"_id": "123", "name": "user1"}
+
+    response = client.get("/api/user/123")
+
+    assert response.status_code == 200
+    auth.create_breadcrumb.assert_not_called()
+
+
+def test_get_user_conditional_get(client, user_service):
+    """Test GET /api/user/<id> returns an ETag and honours If-None-Match."""
+    user = {"_id": "123", "name": "user1", "saved": {"at_time": "t1"}}
+    user_service.get_user.return_value = user
+
+    response = client.get("/api/user/123")
+    etag = response.headers["ETag"]
+
+    assert response.status_code == 200
+    assert etag
+
+    response = client.get("/api/user/123", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+
+    user["saved"] = {"at_time": "t2"}
+    response = client.get("/api/user/123", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json["name"] == "user1"
+
+
+def test_get_user_not_found(client, user_service):
+    """Test GET /api/user/<id> when document is not found."""
+    user_service.get_user.side_effect = HTTPNotFound("User 999 not found")
+
+    response = client.get("/api/user/999")
+
+    assert response.status_code == 404
+    assert response.json["error"] == "User 999 not found"
+
+
+def test_create_user_unauthorized(client, auth):
+    """Test POST /api/user when token is invalid."""
+    auth.create_token.side_effect = HTTPUnauthorized("Invalid token")
+
+    response = client.post(
+        "/api/user",
+        json={"name": "test"},
+    )
+
+    assert response.status_code == 401
+    assert "error" in response.json
+
+
+def test_get_users_unauthorized_skips_handler(client, user_service, auth):
+    """Test the before_request hook rejects a bad token before the handler runs."""
+    auth.create_token.side_effect = HTTPUnauthorized("Invalid token")
+
+    response = client.get("/api/user")
+
+    assert response.status_code == 401
+    assert "error" in response.json
+    user_service.get_users.assert_not_called()
+
+
+def test_options_needs_no_token(client, auth):
+    """Test OPTIONS is answered by Flask without authenticating."""
+    auth.create_token.side_effect = HTTPUnauthorized("Invalid token")
+
+    response = client.options("/api/user")
+
+    assert response.status_code == 200
+    assert set(response.headers["Allow"].split(", ")) >= {"GET", "POST", "OPTIONS"}
+    auth.create_token.assert_not_called()
+
+
+def test_head_uses_lazy_breadcrumb(client, user_service, auth):
+    """Test HEAD /api/user/<id> skips breadcrumb creation like GET."""
+    user_service.get_user.return_value = {"_id": "123", "name": "user1"}
+
+    response = client.head("/api/user/123")
+
+    assert response.status_code == 200
+    auth.create_breadcrumb.assert_not_called()
+
 
-        self.assertEqual(response.status_code, 401)
-        self.assertIn("error", response.json)
+@pytest.mark.benchmark
+def test_bench_get_users(benchmark, client, user_service):
+    """Benchmark GET /api/user?limit=100 with a full page from the service."""
+    user_service.get_users.return_value = {
+        "items": [{"_id": str(i), "name": f"u{i}"} for i in range(100)],
+        "limit": 100,
+        "has_more": False,
+        "next_cursor": None,
+    }
 
+    response = benchmark(client.get, "/api/user?limit=100")
 
-if __name__ == "__main__":
-    unittest.main()
+    assert response.status_code == 200
+    assert len(response.json["items"]) == 100
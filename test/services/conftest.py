@@ -0,0 +1,30 @@
+"""
+Shared pytest fixtures for service tests.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from .fakes import FakeMongo
+
+
+@pytest.fixture
+def mongo(monkeypatch):
+    """Fresh FakeMongo, installed as the MongoIO.get_instance() singleton."""
+    mongo = FakeMongo()
+    monkeypatch.setattr(
+        "src.services.crud_service.MongoIO.get_instance", lambda: mongo
+    )
+    return mongo
+
+
+@pytest.fixture(autouse=True)
+def config(monkeypatch):
+    """Plain Config stand-in with the collection names, installed for every test."""
+    config = SimpleNamespace(
+        PLATFORM_COLLECTION_NAME="Platform", USER_COLLECTION_NAME="User"
+    )
+    monkeypatch.setattr(
+        "src.services.crud_service.Config.get_instance", lambda: config
+    )
+    return config
@@ -0,0 +1,81 @@
+"""
+Hand-written MongoIO fake for the service tests.
+
+FakeMongo keeps documents in a dict and records every call as a plain
+(method, *args) tuple, so tests assert on ordinary Python values instead of
+going through MagicMock's call machinery.
+"""
+from collections.abc import Mapping
+
+
+def _stored(value):
+    """Return value as MongoDB would read it back: mappings become plain dicts."""
+    if isinstance(value, Mapping):
+        return {key: _stored(item) for key, item in value.items()}
+    return value
+
+
+class FakeCollection:
+    """PyMongo collection stand-in backed by a list of documents."""
+
+    def __init__(self, record):
+        self.documents = []
+        self._record = record
+
+    def find(self, query, projection=None, **kwargs):
+        self._record("find", query, projection)
+        return list(self.documents)
+
+    def find_one(self, query, projection=None):
+        self._record("find_one", query, projection)
+        return None
+
+    def create_index(self, keys):
+        self._record("create_index", keys)
+
+
+class FakeMongo:
+    """In-memory MongoIO stand-in; use fail() to make a method raise."""
+
+    def __init__(self):
+        self.documents = {}
+        self.calls = []
+        self.next_id = "123"
+        self.collection = FakeCollection(self._record)
+        self._errors = {}
+
+    def fail(self, method, error=None):
+        """Make method (a MongoIO or collection method name) raise error."""
+        self._errors[method] = error or Exception("Database error")
+
+    def called(self, method):
+        """Return the recorded calls to method, without the method name."""
+        return [call[1:] for call in self.calls if call[0] == method]
+
+    def _record(self, method, *args):
+        self.calls.append((method, *args))
+        if method in self._errors:
+            raise self._errors[method]
+
+    def get_collection(self, collection_name):
+        self._record("get_collection", collection_name)
+        return self.collection
+
+    def create_document(self, collection_name, data):
+        self._record("create_document", collection_name, data)
+        self.documents[self.next_id] = _stored({**data, "_id": self.next_id})
+        return self.next_id
+
+    def get_document(self, collection_name, document_id):
+        self._record("get_document", collection_name, document_id)
+        document = self.documents.get(document_id)
+        return dict(document) if document is not None else None
+
+    def update_document(self, collection_name, document_id=None, set_data=None):
+        self._record("update_document", collection_name, document_id, set_data)
+        if document_id not in self.documents:
+            return None
+        self.documents[document_id] = _stored(
+            {**self.documents[document_id], **set_data}
+        )
+        return dict(self.documents[document_id])
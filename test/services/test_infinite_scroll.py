@@ -0,0 +1,222 @@
+"""
+Unit tests for the infinite scroll query.
+"""
+import unittest
+from unittest.mock import MagicMock
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
+from src.services.infinite_scroll import (
+    execute_infinite_scroll_query,
+    parse_fields_param,
+)
+from api_utils.flask_utils.exceptions import HTTPBadRequest
+
+
+class TestInfiniteScrollQuery(unittest.TestCase):
+    """Test cases for execute_infinite_scroll_query."""
+
+    def setUp(self):
+        """Set up a collection mock returning three documents."""
+        self.docs = [
+            {"_id": ObjectId("507f1f77bcf86cd799439011"), "name": "alpha"},
+            {"_id": ObjectId("507f1f77bcf86cd799439012"), "name": "beta"},
+            {"_id": ObjectId("507f1f77bcf86cd799439013"), "name": "gamma"},
+        ]
+        self.collection = MagicMock()
+        self.collection.find.return_value = iter(self.docs)
+        self.allowed = ["name", "description"]
+
+    def test_first_batch_without_more(self):
+        """Test a batch smaller than the limit reports no more items."""
+        result = execute_infinite_scroll_query(
+            self.collection, limit=10, allowed_sort_fields=self.allowed
+        )
+
+        self.assertEqual(result["items"], self.docs)
+        self.assertEqual(result["limit"], 10)
+        self.assertFalse(result["has_more"])
+        self.assertIsNone(result["next_cursor"])
+        self.collection.find.assert_called_once_with(
+            {},
+            None,
+            sort=[("name", ASCENDING), ("_id", ASCENDING)],
+            limit=11,
+            batch_size=11,
+        )
+
+    def test_batch_with_more(self):
+        """Test the extra document is trimmed and sets the next cursor."""
+        result = execute_infinite_scroll_query(
+            self.collection, limit=2, allowed_sort_fields=self.allowed
+        )
+
+        self.assertEqual(result["items"], self.docs[:2])
+        self.assertTrue(result["has_more"])
+        self.assertEqual(result["next_cursor"], "507f1f77bcf86cd799439012")
+
+    def test_name_filter_is_anchored_prefix(self):
+        """Test the name filter is an escaped, anchored, case-insensitive regex."""
+        execute_infinite_scroll_query(
+            self.collection, name="a.b", allowed_sort_fields=self.allowed
+        )
+
+        query = self.collection.find.call_args[0][0]
+        self.assertEqual(query["name"], {"$regex": "^a\\.b", "$options": "i"})
+
+    def test_fields_become_projection(self):
+        """Test requested fields are passed to find as an inclusion projection."""
+        execute_infinite_scroll_query(
+            self.collection,
+            fields=("name", "status"),
+            allowed_sort_fields=self.allowed,
+        )
+
+        projection = self.collection.find.call_args[0][1]
+        self.assertEqual(projection, {"name": 1, "status": 1})
+
+    def test_after_id_uses_keyset_on_sort_field(self):
+        """Test after_id resumes after the cursor's (sort value, _id) pair."""
+        cursor_id = ObjectId("507f1f77bcf86cd799439011")
+        self.collection.find_one.return_value = {"_id": cursor_id, "name": "alpha"}
+
+        execute_infinite_scroll_query(
+            self.collection,
+            name="a",
+            after_id=str(cursor_id),
+            allowed_sort_fields=self.allowed,
+        )
+
+        self.collection.find_one.assert_called_once_with({"_id": cursor_id}, {"name": 1})
+        query = self.collection.find.call_args[0][0]
+        self.assertEqual(query["name"], {"$regex": "^a", "$options": "i"})
+        self.assertEqual(
+            query["$or"],
+            [
+                {"name": {"$gt": "alpha"}},
+                {"name": "alpha", "_id": {"$gt": cursor_id}},
+            ],
+        )
+
+    def test_after_id_desc_on_nested_field(self):
+        """Test descending keyset on a dotted field also reaches null values."""
+        cursor_id = ObjectId("507f1f77bcf86cd799439011")
+        self.collection.find_one.return_value = {
+            "_id": cursor_id,
+            "created": {"at_time": "2024-01-01T00:00:00Z"},
+        }
+
+        execute_infinite_scroll_query(
+            self.collection,
+            after_id=str(cursor_id),
+            sort_by="created.at_time",
+            order="desc",
+            allowed_sort_fields=["created.at_time"],
+        )
+
+        args, kwargs = self.collection.find.call_args
+        self.assertEqual(
+            args[0]["$or"],
+            [
+                {"created.at_time": {"$lt": "2024-01-01T00:00:00Z"}},
+                {"created.at_time": "2024-01-01T00:00:00Z", "_id": {"$lt": cursor_id}},
+                {"created.at_time": None},
+            ],
+        )
+        self.assertEqual(
+            kwargs["sort"], [("created.at_time", DESCENDING), ("_id", DESCENDING)]
+        )
+
+    def test_after_id_with_missing_sort_value(self):
+        """Test an anchor without the sort field continues into non-null values."""
+        cursor_id = ObjectId("507f1f77bcf86cd799439011")
+        self.collection.find_one.return_value = {"_id": cursor_id}
+
+        execute_infinite_scroll_query(
+            self.collection,
+            after_id=str(cursor_id),
+            sort_by="description",
+            allowed_sort_fields=self.allowed,
+        )
+
+        query = self.collection.find.call_args[0][0]
+        self.assertEqual(
+            query["$or"],
+            [
+                {"description": None, "_id": {"$gt": cursor_id}},
+                {"description": {"$ne": None}},
+            ],
+        )
+
+    def test_after_id_not_found(self):
+        """Test an after_id that matches no document is rejected."""
+        self.collection.find_one.return_value = None
+
+        with self.assertRaises(HTTPBadRequest):
+            execute_infinite_scroll_query(
+                self.collection,
+                after_id="507f1f77bcf86cd799439011",
+                allowed_sort_fields=self.allowed,
+            )
+        self.collection.find.assert_not_called()
+
+    def test_invalid_parameters(self):
+        """Test invalid parameters raise HTTPBadRequest before querying."""
+        cases = [
+            ({"limit": 0}, "limit must be >= 1"),
+            ({"limit": 101}, "limit must be <= 100"),
+            ({"sort_by": "invalid_field"}, "sort_by must be one of"),
+            ({"order": "invalid"}, "order must be 'asc' or 'desc'"),
+            ({"after_id": "invalid"}, "after_id must be a valid MongoDB ObjectId"),
+        ]
+        for kwargs, message in cases:
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(HTTPBadRequest) as context:
+                    execute_infinite_scroll_query(
+                        self.collection, allowed_sort_fields=self.allowed, **kwargs
+                    )
+                self.assertIn(message, str(context.exception))
+        self.collection.find.assert_not_called()
+
+
+class TestParseFieldsParam(unittest.TestCase):
+    """Test cases for parse_fields_param."""
+
+    def test_empty_means_whole_documents(self):
+        """Test a missing or blank parameter returns None."""
+        for value in (None, "", " , "):
+            with self.subTest(value=value):
+                self.assertIsNone(parse_fields_param(value))
+
+    def test_fields_are_normalized(self):
+        """Test names are trimmed, de-duplicated and sorted."""
+        self.assertEqual(
+            parse_fields_param(" status,name,,created.at_time,name "),
+            ("created.at_time", "name", "status"),
+        )
+
+    def test_invalid_field_names_rejected(self):
+        """Test operator and malformed field names raise HTTPBadRequest."""
+        for value in ("$where", "name,$expr", "a..b", "name.", "1abc"):
+            with self.subTest(value=value):
+                with self.assertRaises(HTTPBadRequest) as context:
+                    parse_fields_param(value)
+                self.assertIn("fields contains an invalid field name", str(context.exception))
+
+    def test_overlapping_paths_rejected(self):
+        """Test a field inside another requested field raises HTTPBadRequest."""
+        for value in ("created,created.at_time", "saved.at_time,saved", "a.b,a.b.c"):
+            with self.subTest(value=value):
+                with self.assertRaises(HTTPBadRequest) as context:
+                    parse_fields_param(value)
+                self.assertIn("fields contains overlapping paths", str(context.exception))
+
+    def test_sibling_paths_allowed(self):
+        """Test paths that only share a prefix string are not overlapping."""
+        self.assertEqual(
+            parse_fields_param("created.at_time,created.by_user,name,names"),
+            ("created.at_time", "created.by_user", "name", "names"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
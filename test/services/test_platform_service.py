@@ -4,7 +4,9 @@ Unit tests for Platform service.
 import unittest
 from unittest.mock import patch, MagicMock
 from bson import ObjectId
-from src.services.platform_service import PlatformService
+from src.services.platform_service import PlatformService, ALLOWED_SORT_FIELDS
+from src.cache import list_cache, document_cache
+from src.services import crud_service
 from api_utils.flask_utils.exceptions import (
     HTTPBadRequest,
     HTTPForbidden,
@@ -25,9 +27,67 @@ class TestPlatformService(unittest.TestCase):
             "from_ip": "127.0.0.1",
             "correlation_id": "test-correlation-id",
         }
+        list_cache.clear()
+        document_cache.clear()
+        # Unbind the MongoIO/Config singletons so each test resolves its own
+        bindings = patch.multiple(crud_service, _mongo=None, _config=None)
+        bindings.start()
+        self.addCleanup(bindings.stop)
+
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
+    def test_singletons_resolved_once(self, mock_get_mongo, mock_get_config):
+        """Test that MongoIO and Config are looked up once, not per call."""
+        # Arrange
+        mock_config = MagicMock()
+        mock_config.PLATFORM_COLLECTION_NAME = "Platform"
+        mock_get_config.return_value = mock_config
+        mock_mongo = MagicMock()
+        mock_mongo.get_document.return_value = {"_id": "123", "name": "test-platform"}
+        mock_get_mongo.return_value = mock_mongo
+
+        # Act
+        PlatformService.get_platform("123", self.mock_token, self.mock_breadcrumb)
+        PlatformService.get_platform("456", self.mock_token, self.mock_breadcrumb)
+
+        # Assert
+        mock_get_mongo.assert_called_once()
+        mock_get_config.assert_called_once()
+        self.assertEqual(mock_mongo.get_document.call_count, 2)
+
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
+    def test_ensure_indexes(self, mock_get_mongo, mock_get_config):
+        """Test ensure_indexes creates a (field, _id) index per sort field."""
+        mock_config = MagicMock()
+        mock_config.PLATFORM_COLLECTION_NAME = "Platform"
+        mock_get_config.return_value = mock_config
+        mock_mongo = MagicMock()
+        mock_get_mongo.return_value = mock_mongo
+
+        PlatformService.ensure_indexes()
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+        mock_mongo.get_collection.assert_called_once_with("Platform")
+        create_index = mock_mongo.get_collection.return_value.create_index
+        self.assertEqual(
+            [c.args[0] for c in create_index.call_args_list],
+            [[(field, 1), ("_id", 1)] for field in ALLOWED_SORT_FIELDS],
+        )
+
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
+    def test_ensure_indexes_logs_failure(self, mock_get_mongo, mock_get_config):
+        """Test ensure_indexes does not raise when index creation fails."""
+        mock_mongo = MagicMock()
+        mock_mongo.get_collection.return_value.create_index.side_effect = Exception(
+            "not authorized"
+        )
+        mock_get_mongo.return_value = mock_mongo
+
+        PlatformService.ensure_indexes()
+
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_create_platform_success(self, mock_get_mongo, mock_get_config):
         """Test successful creation of a platform document."""
         mock_config = MagicMock()
@@ -44,11 +104,13 @@ class TestPlatformService(unittest.TestCase):
             "status": "active",
         }
 
-        platform_id = PlatformService.create_platform(
+        platform = PlatformService.create_platform(
             data, self.mock_token, self.mock_breadcrumb
         )
 
-        self.assertEqual(platform_id, "123")
+        self.assertEqual(platform["_id"], "123")
+        self.assertEqual(platform["name"], "test-platform")
+        self.assertEqual(platform["created"], self.mock_breadcrumb)
         mock_mongo.create_document.assert_called_once()
         call_args = mock_mongo.create_document.call_args
         self.assertEqual(call_args[0][0], "Platform")
@@ -57,8 +119,8 @@ class TestPlatformService(unittest.TestCase):
         self.assertIn("saved", created_data)
         self.assertEqual(created_data["name"], "test-platform")
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_create_platform_removes_id(self, mock_get_mongo, mock_get_config):
         """Test that _id is removed from data before creation."""
         mock_config = MagicMock()
@@ -79,8 +141,8 @@ class TestPlatformService(unittest.TestCase):
         created_data = call_args[0][1]
         self.assertNotIn("_id", created_data)
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_get_platforms_first_batch(self, mock_get_mongo, mock_get_config):
         """Test successful retrieval of first batch (no cursor)."""
         mock_config = MagicMock()
@@ -116,8 +178,69 @@ class TestPlatformService(unittest.TestCase):
         self.assertFalse(result["has_more"])
         self.assertIsNone(result["next_cursor"])
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.execute_infinite_scroll_query")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
+    def test_get_platforms_served_from_cache(
+        self, mock_get_mongo, mock_get_config, mock_query
+    ):
+        """Test repeated get_platforms queries are served from the list cache."""
+        mock_config = MagicMock()
+        mock_config.PLATFORM_COLLECTION_NAME = "Platform"
+        mock_get_config.return_value = mock_config
+        mock_query.return_value = {
+            "items": [],
+            "limit": 10,
+            "has_more": False,
+            "next_cursor": None,
+        }
+
+        first = PlatformService.get_platforms(self.mock_token, self.mock_breadcrumb)
+        second = PlatformService.get_platforms(self.mock_token, self.mock_breadcrumb)
+
+        self.assertEqual(first, second)
+        mock_query.assert_called_once()
+
+        PlatformService.get_platforms(
+            self.mock_token, self.mock_breadcrumb, name="other"
+        )
+        self.assertEqual(mock_query.call_count, 2)
+
+    @patch("src.services.crud_service.execute_infinite_scroll_query")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
+    def test_platform_mutations_invalidate_list_cache(
+        self, mock_get_mongo, mock_get_config, mock_query
+    ):
+        """Test create and update invalidate cached get_platforms results."""
+        mock_config = MagicMock()
+        mock_config.PLATFORM_COLLECTION_NAME = "Platform"
+        mock_get_config.return_value = mock_config
+        mock_mongo = MagicMock()
+        mock_mongo.create_document.return_value = "123"
+        mock_mongo.update_document.return_value = {"_id": "123", "name": "updated"}
+        mock_get_mongo.return_value = mock_mongo
+        mock_query.return_value = {
+            "items": [],
+            "limit": 10,
+            "has_more": False,
+            "next_cursor": None,
+        }
+
+        PlatformService.get_platforms(self.mock_token, self.mock_breadcrumb)
+        PlatformService.create_platform(
+            {"name": "new"}, self.mock_token, self.mock_breadcrumb
+        )
+        PlatformService.get_platforms(self.mock_token, self.mock_breadcrumb)
+        PlatformService.update_platform(
+            "123", {"name": "updated"}, self.mock_token, self.mock_breadcrumb
+        )
+        PlatformService.get_platforms(self.mock_token, self.mock_breadcrumb)
+
+        self.assertEqual(mock_query.call_count, 3)
+
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_get_platforms_invalid_limit_too_small(self, mock_get_mongo, mock_get_config):
         """Test get_platforms raises HTTPBadRequest for limit < 1."""
         mock_config = MagicMock()
@@ -133,8 +256,8 @@ class TestPlatformService(unittest.TestCase):
             )
         self.assertIn("limit must be >= 1", str(context.exception))
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_get_platforms_invalid_limit_too_large(self, mock_get_mongo, mock_get_config):
         """Test get_platforms raises HTTPBadRequest for limit > 100."""
         mock_config = MagicMock()
@@ -150,8 +273,8 @@ class TestPlatformService(unittest.TestCase):
             )
         self.assertIn("limit must be <= 100", str(context.exception))
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_get_platforms_invalid_sort_by(self, mock_get_mongo, mock_get_config):
         """Test get_platforms raises HTTPBadRequest for invalid sort_by."""
         mock_config = MagicMock()
@@ -169,8 +292,8 @@ class TestPlatformService(unittest.TestCase):
             )
         self.assertIn("sort_by must be one of", str(context.exception))
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_get_platforms_invalid_order(self, mock_get_mongo, mock_get_config):
         """Test get_platforms raises HTTPBadRequest for invalid order."""
         mock_config = MagicMock()
@@ -188,8 +311,8 @@ class TestPlatformService(unittest.TestCase):
             )
         self.assertIn("order must be 'asc' or 'desc'", str(context.exception))
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_get_platforms_invalid_after_id(self, mock_get_mongo, mock_get_config):
         """Test get_platforms raises HTTPBadRequest for invalid after_id."""
         mock_config = MagicMock()
@@ -207,8 +330,8 @@ class TestPlatformService(unittest.TestCase):
             )
         self.assertIn("after_id must be a valid MongoDB ObjectId", str(context.exception))
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_get_platform_success(self, mock_get_mongo, mock_get_config):
         """Test successful retrieval of a specific platform document."""
         mock_config = MagicMock()
@@ -230,8 +353,53 @@ class TestPlatformService(unittest.TestCase):
         self.assertEqual(result["_id"], "123")
         mock_mongo.get_document.assert_called_once_with("Platform", "123")
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
+    def test_get_platform_served_from_cache(self, mock_get_mongo, mock_get_config):
+        """Test repeated get_platform calls are served from the document cache."""
+        mock_config = MagicMock()
+        mock_config.PLATFORM_COLLECTION_NAME = "Platform"
+        mock_get_config.return_value = mock_config
+
+        mock_mongo = MagicMock()
+        mock_mongo.get_document.return_value = {"_id": "123", "name": "platform1"}
+        mock_get_mongo.return_value = mock_mongo
+
+        first = PlatformService.get_platform("123", self.mock_token, self.mock_breadcrumb)
+        second = PlatformService.get_platform("123", self.mock_token, self.mock_breadcrumb)
+
+        self.assertEqual(first, second)
+        mock_mongo.get_document.assert_called_once_with("Platform", "123")
+
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
+    def test_update_platform_invalidates_document_cache(
+        self, mock_get_mongo, mock_get_config
+    ):
+        """Test update_platform drops the cached document."""
+        mock_config = MagicMock()
+        mock_config.PLATFORM_COLLECTION_NAME = "Platform"
+        mock_get_config.return_value = mock_config
+
+        mock_mongo = MagicMock()
+        mock_mongo.get_document.side_effect = [
+            {"_id": "123", "name": "platform1"},
+            {"_id": "123", "name": "updated"},
+        ]
+        mock_mongo.update_document.return_value = {"_id": "123", "name": "updated"}
+        mock_get_mongo.return_value = mock_mongo
+
+        PlatformService.get_platform("123", self.mock_token, self.mock_breadcrumb)
+        PlatformService.update_platform(
+            "123", {"name": "updated"}, self.mock_token, self.mock_breadcrumb
+        )
+        result = PlatformService.get_platform("123", self.mock_token, self.mock_breadcrumb)
+
+        self.assertEqual(result["name"], "updated")
+        self.assertEqual(mock_mongo.get_document.call_count, 2)
+
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_get_platform_not_found(self, mock_get_mongo, mock_get_config):
         """Test get_platform raises HTTPNotFound when document not found."""
         mock_config = MagicMock()
@@ -248,8 +416,8 @@ class TestPlatformService(unittest.TestCase):
             )
         self.assertIn("999", str(context.exception))
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_update_platform_success(self, mock_get_mongo, mock_get_config):
         """Test successful update of a platform document."""
         mock_config = MagicMock()
@@ -278,8 +446,8 @@ class TestPlatformService(unittest.TestCase):
         self.assertIn("saved", set_data)
         self.assertEqual(set_data["name"], "updated-platform")
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_update_platform_prevent_restricted_fields(
         self, mock_get_mongo, mock_get_config
     ):
@@ -312,8 +480,8 @@ class TestPlatformService(unittest.TestCase):
             )
         self.assertIn("saved", str(context.exception))
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_update_platform_not_found(self, mock_get_mongo, mock_get_config):
         """Test update_platform raises HTTPNotFound when document not found."""
         mock_config = MagicMock()
@@ -330,8 +498,8 @@ class TestPlatformService(unittest.TestCase):
             )
         self.assertIn("999", str(context.exception))
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_update_platform_uses_breadcrumb_directly(
         self, mock_get_mongo, mock_get_config
     ):
@@ -361,8 +529,8 @@ class TestPlatformService(unittest.TestCase):
         self.assertEqual(set_data["saved"], breadcrumb)
         self.assertEqual(set_data["saved"]["from_ip"], "192.168.1.1")
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_create_platform_handles_exception(
         self, mock_get_mongo, mock_get_config
     ):
@@ -380,8 +548,8 @@ class TestPlatformService(unittest.TestCase):
                 {"name": "test"}, self.mock_token, self.mock_breadcrumb
             )
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_get_platforms_handles_exception(
         self, mock_get_mongo, mock_get_config
     ):
@@ -402,8 +570,8 @@ class TestPlatformService(unittest.TestCase):
                 self.mock_token, self.mock_breadcrumb
             )
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_get_platform_handles_exception(
         self, mock_get_mongo, mock_get_config
     ):
@@ -421,8 +589,8 @@ class TestPlatformService(unittest.TestCase):
                 "123", self.mock_token, self.mock_breadcrumb
             )
 
-    @patch("src.services.platform_service.Config.get_instance")
-    @patch("src.services.platform_service.MongoIO.get_instance")
+    @patch("src.services.crud_service.Config.get_instance")
+    @patch("src.services.crud_service.MongoIO.get_instance")
     def test_update_platform_handles_exception(
         self, mock_get_mongo, mock_get_config
     ):
@@ -1,10 +1,11 @@
 """
 Unit tests for User service.
 """
-import unittest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
 from bson import ObjectId
-from src.services.user_service import UserService
 from api_utils.flask_utils.exceptions import (
     HTTPBadRequest,
     HTTPForbidden,
@@ -12,434 +13,286 @@ from api_utils.flask_utils.exceptions import (
     HTTPInternalServerError,
 )
 
+from src.services.user_service import UserService, ALLOWED_SORT_FIELDS
+from src.cache import list_cache, document_cache
+from src.services import crud_service
 
-class TestUserService(unittest.TestCase):
-    """Test cases for UserService."""
+from .fakes import FakeMongo
 
-    def setUp(self):
-        """Set up the test fixture."""
-        self.mock_token = {"user_id": "test_user", "roles": ["admin"]}
-        self.mock_breadcrumb = {
-            "at_time": "2024-01-01T00:00:00Z",
-            "by_user": "test_user",
-            "from_ip": "127.0.0.1",
-            "correlation_id": "test-correlation-id",
-        }
+CONFIG_GET_INSTANCE = "src.services.crud_service.Config.get_instance"
+MONGO_GET_INSTANCE = "src.services.crud_service.MongoIO.get_instance"
 
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_create_user_success(self, mock_get_mongo, mock_get_config):
-        """Test successful creation of a user document."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-
-        mock_mongo = MagicMock()
-        mock_mongo.create_document.return_value = "123"
-        mock_get_mongo.return_value = mock_mongo
-
-        data = {
-            "name": "test-user",
-            "description": "Test user",
-            "status": "active",
-        }
+# Built once at import; find() results are only read, so tests can share them.
+_FAKE_DOCS = [
+    {"_id": ObjectId("507f1f77bcf86cd799439011"), "name": "user1"},
+    {"_id": ObjectId("507f1f77bcf86cd799439012"), "name": "user2"},
+]
 
-        user_id = UserService.create_user(
-            data, self.mock_token, self.mock_breadcrumb
-        )
-
-        self.assertEqual(user_id, "123")
-        mock_mongo.create_document.assert_called_once()
-        call_args = mock_mongo.create_document.call_args
-        self.assertEqual(call_args[0][0], "User")
-        created_data = call_args[0][1]
-        self.assertIn("created", created_data)
-        self.assertIn("saved", created_data)
-        self.assertEqual(created_data["name"], "test-user")
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_create_user_removes_id(self, mock_get_mongo, mock_get_config):
-        """Test that _id is removed from data before creation."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-
-        mock_mongo = MagicMock()
-        mock_mongo.create_document.return_value = "123"
-        mock_get_mongo.return_value = mock_mongo
-
-        data = {"_id": "should-be-removed", "name": "test"}
-
-        UserService.create_user(
-            data, self.mock_token, self.mock_breadcrumb
-        )
-
-        call_args = mock_mongo.create_document.call_args
-        created_data = call_args[0][1]
-        self.assertNotIn("_id", created_data)
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_get_users_first_batch(self, mock_get_mongo, mock_get_config):
-        """Test successful retrieval of first batch (no cursor)."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-
-        mock_collection = MagicMock()
-        mock_cursor = MagicMock()
-        mock_collection.find.return_value = mock_cursor
-        mock_cursor.sort.return_value = mock_cursor
-        mock_cursor.limit.return_value = mock_cursor
-        mock_cursor.__iter__ = lambda self: iter(
-            [
-                {"_id": ObjectId("507f1f77bcf86cd799439011"), "name": "user1"},
-                {"_id": ObjectId("507f1f77bcf86cd799439012"), "name": "user2"},
-            ]
-        )
-
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = mock_collection
-        mock_get_mongo.return_value = mock_mongo
-
-        result = UserService.get_users(
-            self.mock_token, self.mock_breadcrumb, limit=10
-        )
-
-        self.assertIn("items", result)
-        self.assertIn("limit", result)
-        self.assertIn("has_more", result)
-        self.assertIn("next_cursor", result)
-        self.assertEqual(len(result["items"]), 2)
-        self.assertEqual(result["limit"], 10)
-        self.assertFalse(result["has_more"])
-        self.assertIsNone(result["next_cursor"])
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_get_users_invalid_limit_too_small(self, mock_get_mongo, mock_get_config):
-        """Test get_users raises HTTPBadRequest for limit < 1."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = MagicMock()
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPBadRequest) as context:
-            UserService.get_users(
-                self.mock_token, self.mock_breadcrumb, limit=0
-            )
-        self.assertIn("limit must be >= 1", str(context.exception))
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_get_users_invalid_limit_too_large(self, mock_get_mongo, mock_get_config):
-        """Test get_users raises HTTPBadRequest for limit > 100."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = MagicMock()
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPBadRequest) as context:
-            UserService.get_users(
-                self.mock_token, self.mock_breadcrumb, limit=101
-            )
-        self.assertIn("limit must be <= 100", str(context.exception))
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_get_users_invalid_sort_by(self, mock_get_mongo, mock_get_config):
-        """Test get_users raises HTTPBadRequest for invalid sort_by."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = MagicMock()
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPBadRequest) as context:
-            UserService.get_users(
-                self.mock_token,
-                self.mock_breadcrumb,
-                sort_by="invalid_field",
-            )
-        self.assertIn("sort_by must be one of", str(context.exception))
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_get_users_invalid_order(self, mock_get_mongo, mock_get_config):
-        """Test get_users raises HTTPBadRequest for invalid order."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = MagicMock()
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPBadRequest) as context:
-            UserService.get_users(
-                self.mock_token,
-                self.mock_breadcrumb,
-                order="invalid",
-            )
-        self.assertIn("order must be 'asc' or 'desc'", str(context.exception))
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_get_users_invalid_after_id(self, mock_get_mongo, mock_get_config):
-        """Test get_users raises HTTPBadRequest for invalid after_id."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = MagicMock()
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPBadRequest) as context:
-            UserService.get_users(
-                self.mock_token,
-                self.mock_breadcrumb,
-                after_id="invalid",
-            )
-        self.assertIn("after_id must be a valid MongoDB ObjectId", str(context.exception))
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_get_user_success(self, mock_get_mongo, mock_get_config):
-        """Test successful retrieval of a specific user document."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-
-        mock_mongo = MagicMock()
-        mock_mongo.get_document.return_value = {
-            "_id": "123",
-            "name": "user1",
-        }
-        mock_get_mongo.return_value = mock_mongo
-
-        result = UserService.get_user(
-            "123", self.mock_token, self.mock_breadcrumb
-        )
-
-        self.assertIsNotNone(result)
-        self.assertEqual(result["_id"], "123")
-        mock_mongo.get_document.assert_called_once_with("User", "123")
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_get_user_not_found(self, mock_get_mongo, mock_get_config):
-        """Test get_user raises HTTPNotFound when document not found."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-
-        mock_mongo = MagicMock()
-        mock_mongo.get_document.return_value = None
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPNotFound) as context:
-            UserService.get_user(
-                "999", self.mock_token, self.mock_breadcrumb
-            )
-        self.assertIn("999", str(context.exception))
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_update_user_success(self, mock_get_mongo, mock_get_config):
-        """Test successful update of a user document."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-
-        mock_mongo = MagicMock()
-        mock_mongo.update_document.return_value = {
-            "_id": "123",
-            "name": "updated-user",
+
+@pytest.fixture(autouse=True)
+def reset_state(mongo, monkeypatch):
+    """Install a fresh FakeMongo, unbind the singletons and empty the caches."""
+    list_cache.clear()
+    document_cache.clear()
+    monkeypatch.setattr(crud_service, "_mongo", None)
+    monkeypatch.setattr(crud_service, "_config", None)
+
+
+def test_singletons_resolved_once(monkeypatch, token, breadcrumb):
+    """Test that MongoIO and Config are looked up once, not per call."""
+    # Arrange
+    config = SimpleNamespace(USER_COLLECTION_NAME="User")
+    mongo = FakeMongo()
+    mongo.documents = {
+        "123": {"_id": "123", "name": "test-user"},
+        "456": {"_id": "456", "name": "other-user"},
+    }
+    get_config = MagicMock(return_value=config)
+    get_mongo = MagicMock(return_value=mongo)
+    monkeypatch.setattr(CONFIG_GET_INSTANCE, get_config)
+    monkeypatch.setattr(MONGO_GET_INSTANCE, get_mongo)
+
+    # Act
+    UserService.get_user("123", token, breadcrumb)
+    UserService.get_user("456", token, breadcrumb)
+
+    # Assert
+    get_mongo.assert_called_once()
+    get_config.assert_called_once()
+    assert len(mongo.called("get_document")) == 2
+
+
+def test_ensure_indexes(mongo):
+    """Test ensure_indexes creates a (field, _id) index per sort field."""
+    UserService.ensure_indexes()
+
+    assert mongo.called("get_collection") == [("User",)]
+    assert mongo.called("create_index") == [
+        ([(field, 1), ("_id", 1)],) for field in ALLOWED_SORT_FIELDS
+    ]
+
+
+def test_ensure_indexes_logs_failure(mongo):
+    """Test ensure_indexes does not raise when index creation fails."""
+    mongo.fail("create_index", Exception("not authorized"))
+
+    UserService.ensure_indexes()
+
+
+def test_create_user_success(mongo, token, breadcrumb):
+    """Test successful creation of a user document."""
+    data = {
+        "name": "test-user",
+        "description": "Test user",
+        "status": "active",
+    }
+
+    user = UserService.create_user(data, token, breadcrumb)
+
+    assert user["_id"] == "123"
+    assert user["name"] == "test-user"
+    assert user["created"] == breadcrumb
+    [(collection_name, created_data)] = mongo.called("create_document")
+    assert collection_name == "User"
+    assert "created" in created_data
+    assert "saved" in created_data
+    assert created_data["name"] == "test-user"
+
+
+def test_create_user_removes_id(mongo, token, breadcrumb):
+    """Test that _id is removed from data before creation."""
+    data = {"_id": "should-be-removed", "name": "test"}
+
+    UserService.create_user(data, token, breadcrumb)
+
+    [(_, created_data)] = mongo.called("create_document")
+    assert "_id" not in created_data
+
+
+def test_get_users_first_batch(mongo, token, breadcrumb):
+    """Test successful retrieval of first batch (no cursor)."""
+    mongo.collection.documents = _FAKE_DOCS
+
+    result = UserService.get_users(token, breadcrumb, limit=10)
+
+    assert set(result) == {"items", "limit", "has_more", "next_cursor"}
+    assert len(result["items"]) == 2
+    assert result["limit"] == 10
+    assert not result["has_more"]
+    assert result["next_cursor"] is None
+
+
+def test_get_users_served_from_cache(monkeypatch, token, breadcrumb):
+    """Test repeated get_users queries are served from the list cache."""
+    query = MagicMock(
+        return_value={
+            "items": [],
+            "limit": 10,
+            "has_more": False,
+            "next_cursor": None,
         }
-        mock_get_mongo.return_value = mock_mongo
-
-        data = {"name": "updated-user", "description": "Updated"}
-
-        updated = UserService.update_user(
-            "123", data, self.mock_token, self.mock_breadcrumb
-        )
-
-        self.assertIsNotNone(updated)
-        self.assertEqual(updated["name"], "updated-user")
-        mock_mongo.update_document.assert_called_once()
-        call_args = mock_mongo.update_document.call_args
-        self.assertEqual(call_args[1]["document_id"], "123")
-        set_data = call_args[1]["set_data"]
-        self.assertIn("saved", set_data)
-        self.assertEqual(set_data["name"], "updated-user")
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_update_user_prevent_restricted_fields(
-        self, mock_get_mongo, mock_get_config
-    ):
-        """Test update_user raises HTTPForbidden for restricted fields."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-
-        mock_mongo = MagicMock()
-        mock_get_mongo.return_value = mock_mongo
-
-        data = {"_id": "999", "name": "Updated"}
-        with self.assertRaises(HTTPForbidden) as context:
-            UserService.update_user(
-                "123", data, self.mock_token, self.mock_breadcrumb
-            )
-        self.assertIn("_id", str(context.exception))
-
-        data = {"created": {"at_time": "2024-01-01T00:00:00Z"}, "name": "Updated"}
-        with self.assertRaises(HTTPForbidden) as context:
-            UserService.update_user(
-                "123", data, self.mock_token, self.mock_breadcrumb
-            )
-        self.assertIn("created", str(context.exception))
-
-        data = {"saved": {"at_time": "2024-01-01T00:00:00Z"}, "name": "Updated"}
-        with self.assertRaises(HTTPForbidden) as context:
-            UserService.update_user(
-                "123", data, self.mock_token, self.mock_breadcrumb
-            )
-        self.assertIn("saved", str(context.exception))
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_update_user_not_found(self, mock_get_mongo, mock_get_config):
-        """Test update_user raises HTTPNotFound when document not found."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-
-        mock_mongo = MagicMock()
-        mock_mongo.update_document.return_value = None
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPNotFound) as context:
-            UserService.update_user(
-                "999", {"name": "Updated"}, self.mock_token, self.mock_breadcrumb
-            )
-        self.assertIn("999", str(context.exception))
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_update_user_uses_breadcrumb_directly(
-        self, mock_get_mongo, mock_get_config
-    ):
-        """Test update_user uses breadcrumb directly for saved field."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-
-        mock_mongo = MagicMock()
-        mock_mongo.update_document.return_value = {"_id": "123", "name": "updated"}
-        mock_get_mongo.return_value = mock_mongo
-
-        breadcrumb = {
-            "from_ip": "192.168.1.1",
-            "at_time": "2024-01-01T00:00:00Z",
-            "by_user": "test_user",
-            "correlation_id": "test-id",
+    )
+    monkeypatch.setattr(crud_service, "execute_infinite_scroll_query", query)
+
+    first = UserService.get_users(token, breadcrumb)
+    second = UserService.get_users(token, breadcrumb)
+
+    assert first == second
+    query.assert_called_once()
+
+    UserService.get_users(token, breadcrumb, name="other")
+    assert query.call_count == 2
+
+
+def test_user_mutations_invalidate_list_cache(mongo, monkeypatch, token, breadcrumb):
+    """Test create and update invalidate cached get_users results."""
+    query = MagicMock(
+        return_value={
+            "items": [],
+            "limit": 10,
+            "has_more": False,
+            "next_cursor": None,
         }
+    )
+    monkeypatch.setattr(crud_service, "execute_infinite_scroll_query", query)
+
+    UserService.get_users(token, breadcrumb)
+    UserService.create_user({"name": "new"}, token, breadcrumb)
+    UserService.get_users(token, breadcrumb)
+    UserService.update_user("123", {"name": "updated"}, token, breadcrumb)
+    UserService.get_users(token, breadcrumb)
+
+    assert query.call_count == 3
+
+
+@pytest.mark.parametrize(
+    "kwargs,message",
+    [
+        ({"limit": 0}, "limit must be >= 1"),
+        ({"limit": 101}, "limit must be <= 100"),
+        ({"sort_by": "invalid_field"}, "sort_by must be one of"),
+        ({"order": "invalid"}, "order must be 'asc' or 'desc'"),
+        ({"after_id": "invalid"}, "after_id must be a valid MongoDB ObjectId"),
+    ],
+)
+def test_get_users_invalid_params(token, breadcrumb, kwargs, message):
+    """Test get_users raises HTTPBadRequest for invalid paging parameters."""
+    with pytest.raises(HTTPBadRequest, match=message):
+        UserService.get_users(token, breadcrumb, **kwargs)
+
+
+def test_get_user_success(mongo, token, breadcrumb):
+    """Test successful retrieval of a specific user document."""
+    mongo.documents["123"] = {"_id": "123", "name": "user1"}
+
+    result = UserService.get_user("123", token, breadcrumb)
+
+    assert result is not None
+    assert result["_id"] == "123"
+    assert mongo.called("get_document") == [("User", "123")]
+
+
+def test_get_user_served_from_cache(mongo, token, breadcrumb):
+    """Test repeated get_user calls are served from the document cache."""
+    mongo.documents["123"] = {"_id": "123", "name": "user1"}
+
+    first = UserService.get_user("123", token, breadcrumb)
+    second = UserService.get_user("123", token, breadcrumb)
+
+    assert first == second
+    assert mongo.called("get_document") == [("User", "123")]
 
-        result = UserService.update_user(
-            "123", {"name": "updated"}, self.mock_token, breadcrumb
-        )
-
-        self.assertIsNotNone(result)
-        call_args = mock_mongo.update_document.call_args
-        set_data = call_args[1]["set_data"]
-        self.assertEqual(set_data["saved"], breadcrumb)
-        self.assertEqual(set_data["saved"]["from_ip"], "192.168.1.1")
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_create_user_handles_exception(
-        self, mock_get_mongo, mock_get_config
-    ):
-        """Test create_user handles database exceptions."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-
-        mock_mongo = MagicMock()
-        mock_mongo.create_document.side_effect = Exception("Database error")
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPInternalServerError):
-            UserService.create_user(
-                {"name": "test"}, self.mock_token, self.mock_breadcrumb
-            )
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_get_users_handles_exception(
-        self, mock_get_mongo, mock_get_config
-    ):
-        """Test get_users handles database exceptions."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-
-        mock_collection = MagicMock()
-        mock_collection.find.side_effect = Exception("Database error")
-
-        mock_mongo = MagicMock()
-        mock_mongo.get_collection.return_value = mock_collection
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPInternalServerError):
-            UserService.get_users(
-                self.mock_token, self.mock_breadcrumb
-            )
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_get_user_handles_exception(
-        self, mock_get_mongo, mock_get_config
-    ):
-        """Test get_user handles database exceptions."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-
-        mock_mongo = MagicMock()
-        mock_mongo.get_document.side_effect = Exception("Database error")
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPInternalServerError):
-            UserService.get_user(
-                "123", self.mock_token, self.mock_breadcrumb
-            )
-
-    @patch("src.services.user_service.Config.get_instance")
-    @patch("src.services.user_service.MongoIO.get_instance")
-    def test_update_user_handles_exception(
-        self, mock_get_mongo, mock_get_config
-    ):
-        """Test update_user handles database exceptions."""
-        mock_config = MagicMock()
-        mock_config.USER_COLLECTION_NAME = "User"
-        mock_get_config.return_value = mock_config
-
-        mock_mongo = MagicMock()
-        mock_mongo.update_document.side_effect = Exception("Database error")
-        mock_get_mongo.return_value = mock_mongo
-
-        with self.assertRaises(HTTPInternalServerError):
-            UserService.update_user(
-                "123", {"name": "updated"}, self.mock_token, self.mock_breadcrumb
-            )
-
-
-if __name__ == "__main__":
-    unittest.main()
+
+def test_update_user_invalidates_document_cache(mongo, token, breadcrumb):
+    """Test update_user drops the cached document."""
+    mongo.documents["123"] = {"_id": "123", "name": "user1"}
+
+    UserService.get_user("123", token, breadcrumb)
+    UserService.update_user("123", {"name": "updated"}, token, breadcrumb)
+    result = UserService.get_user("123", token, breadcrumb)
+
+    assert result["name"] == "updated"
+    assert len(mongo.called("get_document")) == 2
+
+
+def test_get_user_not_found(mongo, token, breadcrumb):
+    """Test get_user raises HTTPNotFound when document not found."""
+    with pytest.raises(HTTPNotFound) as excinfo:
+        UserService.get_user("999", token, breadcrumb)
+    assert "999" in str(excinfo.value)
+
+
+def test_update_user_success(mongo, token, breadcrumb):
+    """Test successful update of a user document."""
+    mongo.documents["123"] = {"_id": "123", "name": "test-user"}
+
+    data = {"name": "updated-user", "description": "Updated"}
+
+    updated = UserService.update_user("123", data, token, breadcrumb)
+
+    assert updated is not None
+    assert updated["name"] == "updated-user"
+    [(_, document_id, set_data)] = mongo.called("update_document")
+    assert document_id == "123"
+    assert "saved" in set_data
+    assert set_data["name"] == "updated-user"
+
+
+@pytest.mark.parametrize(
+    "field,value",
+    [
+        ("_id", "999"),
+        ("created", {"at_time": "2024-01-01T00:00:00Z"}),
+        ("saved", {"at_time": "2024-01-01T00:00:00Z"}),
+    ],
+)
+def test_update_user_prevent_restricted_fields(token, breadcrumb, field, value):
+    """Test update_user raises HTTPForbidden for restricted fields."""
+    data = {field: value, "name": "Updated"}
+    with pytest.raises(HTTPForbidden, match=f"Cannot update {field} field"):
+        UserService.update_user("123", data, token, breadcrumb)
+
+
+def test_update_user_not_found(mongo, token, breadcrumb):
+    """Test update_user raises HTTPNotFound when document not found."""
+    with pytest.raises(HTTPNotFound) as excinfo:
+        UserService.update_user("999", {"name": "Updated"}, token, breadcrumb)
+    assert "999" in str(excinfo.value)
+
+
+def test_update_user_uses_breadcrumb_directly(mongo, token):
+    """Test update_user uses breadcrumb directly for saved field."""
+    mongo.documents["123"] = {"_id": "123", "name": "test-user"}
+
+    breadcrumb = {
+        "from_ip": "192.168.1.1",
+        "at_time": "2024-01-01T00:00:00Z",
+        "by_user": "test_user",
+        "correlation_id": "test-id",
+    }
+
+    result = UserService.update_user("123", {"name": "updated"}, token, breadcrumb)
+
+    assert result is not None
+    [(_, _, set_data)] = mongo.called("update_document")
+    assert set_data["saved"] == breadcrumb
+    assert set_data["saved"]["from_ip"] == "192.168.1.1"
+
+
+@pytest.mark.parametrize(
+    "method,mongo_call,args",
+    [
+        ("create_user", "create_document", ({"name": "test"},)),
+        ("get_users", "find", ()),
+        ("get_user", "get_document", ("123",)),
+        ("update_user", "update_document", ("123", {"name": "updated"})),
+    ],
+)
+def test_service_method_handles_exception(
+    mongo, token, breadcrumb, method, mongo_call, args
+):
+    """Test each UserService method turns database errors into a 500."""
+    mongo.fail(mongo_call)
+
+    with pytest.raises(HTTPInternalServerError):
+        getattr(UserService, method)(*args, token, breadcrumb)
@@ -0,0 +1,75 @@
+"""
+Unit tests for the orjson-backed JSON provider.
+"""
+import json
+import unittest
+from datetime import datetime, timezone
+from bson import ObjectId
+from flask import Flask
+from api_utils import MongoJSONEncoder
+from src.json_provider import ORJSONProvider
+
+
+class TestORJSONProvider(unittest.TestCase):
+    """Test cases for ORJSONProvider."""
+
+    def setUp(self):
+        """Set up a Flask app using the orjson provider."""
+        self.app = Flask(__name__)
+        self.app.json = ORJSONProvider(self.app)
+        self.document = {
+            "_id": ObjectId("507f1f77bcf86cd799439011"),
+            "name": "platform1",
+            "created": {
+                "at_time": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                "correlation_id": "test-correlation-id",
+            },
+            "tags": ["a", "b"],
+            "count": 3,
+        }
+
+    def test_dumps_matches_mongo_encoder(self):
+        """Test ObjectId and datetime values serialize as MongoJSONEncoder does."""
+        expected = MongoJSONEncoder(self.app).dumps(self.document)
+
+        actual = self.app.json.dumps(self.document)
+
+        self.assertEqual(json.loads(actual), json.loads(expected))
+
+    def test_dumps_sorts_keys_by_default(self):
+        """Test key order follows the provider's sort_keys setting."""
+        self.assertEqual(self.app.json.dumps({"b": 1, "a": 2}), '{"a":2,"b":1}')
+
+    def test_loads(self):
+        """Test loads parses str and bytes."""
+        self.assertEqual(self.app.json.loads('{"name": "x"}'), {"name": "x"})
+        self.assertEqual(self.app.json.loads(b'{"name": "x"}'), {"name": "x"})
+
+    def test_jsonify_response(self):
+        """Test jsonify builds an application/json response via orjson."""
+        from flask import jsonify
+
+        with self.app.app_context():
+            response = jsonify(self.document)
+
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.get_json()["_id"], "507f1f77bcf86cd799439011")
+
+    def test_invalid_request_json_returns_400(self):
+        """Test malformed request bodies are still rejected by Flask."""
+
+        @self.app.route("/echo", methods=["POST"])
+        def echo():
+            from flask import request
+
+            return request.get_json()
+
+        response = self.app.test_client().post(
+            "/echo", data="{not json", content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()